@@ -11,8 +11,9 @@ from flask import Flask
 
 from app.config import config
 from app.extensions import init_extensions
-from app.middleware import auth_middleware, logging_middleware, performance_middleware
+from app.middleware import combined_middleware
 from app.utils.error_handlers import register_error_handlers, setup_error_monitoring
+from app.utils.json_provider import ORJSONProvider
 from app.utils.logging_config import configure_logging
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,9 @@ def create_app(config_name="development"):
     """
     app = Flask(__name__)
 
+    # Use orjson for response serialization and request parsing
+    app.json = ORJSONProvider(app)
+
     # Load configuration
     app.config.from_object(config[config_name])
 
@@ -49,6 +53,9 @@ def create_app(config_name="development"):
     # Register blueprints (will be added in later tasks)
     register_blueprints(app)
 
+    # Flag routes that skip auth/logging now that the URL map is complete
+    combined_middleware.mark_skip_rules(app)
+
     logger.info(f"Flask app created with config: {config_name}")
 
     return app
@@ -61,14 +68,9 @@ def init_middleware(app):
     Args:
         app (Flask): Flask application instance
     """
-    # Initialize logging middleware first (to capture all requests)
-    logging_middleware.init_app(app)
-
-    # Initialize performance middleware
-    performance_middleware.init_app(app)
-
-    # Initialize authentication middleware
-    auth_middleware.init_app(app)
+    # Logging, performance and authentication run from a single pair of
+    # request hooks, logging first so it captures all requests
+    combined_middleware.init_app(app)
 
     logger.info("All middleware initialized")
 
@@ -273,6 +273,12 @@ class UserSearchResource(Resource):
     @user_ns.param(
         "include_inactive", "Include inactive users", type="boolean", default=False
     )
+    @user_ns.param(
+        "prefix",
+        "Only match usernames/emails starting with the term",
+        type="boolean",
+        default=False,
+    )
     @user_ns.marshal_with(
         user_list_response_model, code=200, description="Search completed successfully"
     )
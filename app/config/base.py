@@ -20,6 +20,9 @@ class BaseConfig:
     JWT_SECRET_KEY = os.environ.get("JWT_SECRET_KEY") or SECRET_KEY
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
+    JWT_USER_CACHE_ENABLED = (
+        os.environ.get("JWT_USER_CACHE_ENABLED", "true").lower() == "true"
+    )
 
     # CORS configuration
     CORS_ORIGINS = os.environ.get("CORS_ORIGINS", "*").split(",")
@@ -31,11 +34,16 @@ class BaseConfig:
     LOG_FILE = os.environ.get("LOG_FILE", None)
     LOG_MAX_BYTES = int(os.environ.get("LOG_MAX_BYTES", 10485760))  # 10MB
     LOG_BACKUP_COUNT = int(os.environ.get("LOG_BACKUP_COUNT", 5))
+    LOG_SAMPLE_RATE = float(os.environ.get("LOG_SAMPLE_RATE", 1.0))  # 2xx/3xx only
+    LOG_QUEUE_ENABLED = os.environ.get("LOG_QUEUE_ENABLED", "true").lower() == "true"
 
     # Pagination
     DEFAULT_PAGE_SIZE = 20
     MAX_PAGE_SIZE = 100
 
+    # Caching (seconds, 0 disables)
+    USER_STATISTICS_CACHE_TTL = int(os.environ.get("USER_STATISTICS_CACHE_TTL", 60))
+
     # API configuration
     API_TITLE = "Flask API Template"
     API_VERSION = "v1"
@@ -46,6 +54,8 @@ class BaseConfig:
     ERROR_INCLUDE_DETAILS = True
     ERROR_INCLUDE_TRACEBACK = False
     SLOW_REQUEST_THRESHOLD = 1.0  # seconds
+    # Slow SQL query warning threshold (milliseconds, 0 disables)
+    SLOW_QUERY_THRESHOLD_MS = int(os.environ.get("SLOW_QUERY_THRESHOLD_MS", 100))
     ERROR_MONITORING_ENABLED = True
 
     @staticmethod
@@ -24,8 +24,13 @@ class TestingConfig(BaseConfig):
     # JWT configuration for testing
     JWT_ACCESS_TOKEN_EXPIRES = False  # Tokens don't expire in tests
 
+    # Disable caches so tests observe fresh data
+    USER_STATISTICS_CACHE_TTL = 0
+    JWT_USER_CACHE_ENABLED = False
+
     # Logging configuration
     LOG_LEVEL = "WARNING"
+    LOG_QUEUE_ENABLED = False
 
     @staticmethod
     def init_app(app):
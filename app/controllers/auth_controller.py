@@ -28,7 +28,7 @@ class LoginRequestSchema(Schema):
         required=True, validate=validate.Length(min=1, max=120)
     )
     password = fields.Str(required=True, validate=validate.Length(min=1))
-    remember_me = fields.Bool(missing=False)
+    remember_me = fields.Bool(load_default=False)
 
 
 class RegisterRequestSchema(Schema):
@@ -67,6 +67,15 @@ class EmailVerificationSchema(Schema):
     token = fields.Str(required=True, validate=validate.Length(min=1))
 
 
+# Schemas hold no per-request state, so one instance of each is shared
+login_request_schema = LoginRequestSchema()
+register_request_schema = RegisterRequestSchema()
+password_reset_request_schema = PasswordResetRequestSchema()
+password_reset_schema = PasswordResetSchema()
+change_password_schema = ChangePasswordSchema()
+email_verification_schema = EmailVerificationSchema()
+
+
 def handle_validation_error(error):
     """
     Handle marshmallow validation errors.
@@ -129,8 +138,7 @@ def login():
 
     try:
         # Validate request data
-        schema = LoginRequestSchema()
-        data = schema.load(request.get_json() or {})
+        data = login_request_schema.load(request.get_json() or {})
 
         # Authenticate user
         result = AuthService.login(
@@ -191,8 +199,7 @@ def register():
 
     try:
         # Validate request data
-        schema = RegisterRequestSchema()
-        data = schema.load(request.get_json() or {})
+        data = register_request_schema.load(request.get_json() or {})
 
         # Register user
         result = AuthService.register(
@@ -315,8 +322,7 @@ def request_password_reset():
 
     try:
         # Validate request data
-        schema = PasswordResetRequestSchema()
-        data = schema.load(request.get_json() or {})
+        data = password_reset_request_schema.load(request.get_json() or {})
 
         # Process password reset request
         result = AuthService.request_password_reset(data["email"])
@@ -377,8 +383,7 @@ def reset_password():
 
     try:
         # Validate request data
-        schema = PasswordResetSchema()
-        data = schema.load(request.get_json() or {})
+        data = password_reset_schema.load(request.get_json() or {})
 
         # Reset password
         result = AuthService.reset_password(
@@ -435,8 +440,7 @@ def change_password():
         current_user = get_current_user()
 
         # Validate request data
-        schema = ChangePasswordSchema()
-        data = schema.load(request.get_json() or {})
+        data = change_password_schema.load(request.get_json() or {})
 
         # Change password
         result = AuthService.change_password(
@@ -486,8 +490,7 @@ def verify_email():
 
     try:
         # Validate request data
-        schema = EmailVerificationSchema()
-        data = schema.load(request.get_json() or {})
+        data = email_verification_schema.load(request.get_json() or {})
 
         # Verify email
         result = AuthService.verify_email(data["token"])
@@ -5,9 +5,10 @@ This module provides REST API endpoints for user management including
 CRUD operations, user information queries and updates, and user permission management.
 """
 
+import hashlib
 import logging
 
-from flask import Blueprint, current_app, jsonify, request
+from flask import Blueprint, Response, current_app, jsonify, request
 from flask_jwt_extended import get_current_user, jwt_required
 from marshmallow import Schema, ValidationError, fields, validate
 
@@ -19,6 +20,14 @@ logger = logging.getLogger(__name__)
 # Create user management blueprint
 user_bp = Blueprint("users", __name__, url_prefix="/api/users")
 
+# Fields only administrators may change through update_user
+_ADMIN_ONLY_FIELDS = frozenset({"is_active", "is_verified", "is_admin"})
+
+# Pre-serialized bodies for constant error responses
+_NOT_FOUND_BODY = b'{"error":"Endpoint not found","code":"NOT_FOUND"}'
+_METHOD_NOT_ALLOWED_BODY = b'{"error":"Method not allowed","code":"METHOD_NOT_ALLOWED"}'
+_INTERNAL_ERROR_BODY = b'{"error":"Internal server error","code":"INTERNAL_ERROR"}'
+
 
 # Request/Response Schemas for validation and documentation
 class CreateUserRequestSchema(Schema):
@@ -29,8 +38,8 @@ class CreateUserRequestSchema(Schema):
     password = fields.Str(validate=validate.Length(min=8), allow_none=True)
     first_name = fields.Str(validate=validate.Length(max=50), allow_none=True)
     last_name = fields.Str(validate=validate.Length(max=50), allow_none=True)
-    is_admin = fields.Bool(missing=False)
-    is_verified = fields.Bool(missing=False)
+    is_admin = fields.Bool(load_default=False)
+    is_verified = fields.Bool(load_default=False)
 
 
 class UpdateUserRequestSchema(Schema):
@@ -49,23 +58,33 @@ class UpdateUserRequestSchema(Schema):
 class UserQuerySchema(Schema):
     """Schema for user query parameters validation."""
 
-    page = fields.Int(validate=validate.Range(min=1), missing=1)
-    per_page = fields.Int(validate=validate.Range(min=1, max=100), missing=20)
-    include_inactive = fields.Bool(missing=False)
+    page = fields.Int(validate=validate.Range(min=1), load_default=1)
+    per_page = fields.Int(validate=validate.Range(min=1, max=100), load_default=20)
+    include_inactive = fields.Bool(load_default=False)
     search = fields.Str(validate=validate.Length(max=100), allow_none=True)
     sort_by = fields.Str(
         validate=validate.OneOf(["created_at", "updated_at", "username", "email"]),
-        missing="created_at",
+        load_default="created_at",
+    )
+    sort_order = fields.Str(
+        validate=validate.OneOf(["asc", "desc"]), load_default="desc"
     )
-    sort_order = fields.Str(validate=validate.OneOf(["asc", "desc"]), missing="desc")
 
 
 class UserSearchSchema(Schema):
     """Schema for user search parameters validation."""
 
     q = fields.Str(required=True, validate=validate.Length(min=2, max=100))
-    limit = fields.Int(validate=validate.Range(min=1, max=50), missing=20)
-    include_inactive = fields.Bool(missing=False)
+    limit = fields.Int(validate=validate.Range(min=1, max=50), load_default=20)
+    include_inactive = fields.Bool(load_default=False)
+    prefix = fields.Bool(load_default=False)
+
+
+# Schemas hold no per-request state, so one instance of each is shared
+user_query_schema = UserQuerySchema()
+create_user_request_schema = CreateUserRequestSchema()
+update_user_request_schema = UpdateUserRequestSchema()
+user_search_schema = UserSearchSchema()
 
 
 def handle_validation_error(error):
@@ -134,15 +153,55 @@ def check_user_access_permission(current_user, target_user_id):
     Returns:
         bool: True if access is allowed, False otherwise
     """
-    # Users can always access their own information
-    if current_user.id == target_user_id:
-        return True
+    # Users can always access their own information; admins can access anyone's
+    return current_user.id == target_user_id or current_user.is_admin
+
+
+def user_etag(user):
+    """
+    Build a weak ETag for a user's serialized representation.
+
+    Args:
+        user (User): User instance
+
+    Returns:
+        str: ETag value (without the W/ prefix and quotes)
+    """
+    updated_at = user.updated_at.timestamp() if user.updated_at else 0
+    return f"{user.id}-{updated_at:.6f}-{int(user.is_lock_active())}"
+
+
+def statistics_etag(stats):
+    """
+    Build a weak ETag for a user statistics payload.
+
+    Args:
+        stats (dict): Statistics returned by the user service
+
+    Returns:
+        str: ETag value (without the W/ prefix and quotes)
+    """
+    counters = sorted((k, v) for k, v in stats.items() if k != "generated_at")
+    return hashlib.sha1(repr(counters).encode()).hexdigest()[:16]
 
-    # Admin users can access any user's information
-    if current_user.is_admin:
-        return True
 
-    return False
+def set_cache_validators(response, etag):
+    """
+    Attach the weak ETag and revalidation policy to a response.
+
+    Applied to both 200 and 304 responses, since a 304 must carry the
+    validators the full response would have sent.
+
+    Args:
+        response (Response): Response to update
+        etag (str): ETag value (without the W/ prefix and quotes)
+
+    Returns:
+        Response: The updated response
+    """
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
 
 
 @user_bp.route("", methods=["GET"])
@@ -174,41 +233,26 @@ def get_users():
     """
     logger.info("Get users request received")
 
-    try:
-        # Get current user and check permissions
-        current_user = get_current_user()
-        check_admin_permission(current_user)
-
-        # Validate query parameters
-        schema = UserQuerySchema()
-        query_params = schema.load(request.args.to_dict())
-
-        # Get users from service
-        result = UserService.get_users(
-            page=query_params["page"],
-            per_page=query_params["per_page"],
-            include_inactive=query_params["include_inactive"],
-            search=query_params.get("search"),
-            sort_by=query_params["sort_by"],
-            sort_order=query_params["sort_order"],
-        )
+    # Get current user and check permissions
+    current_user = get_current_user()
+    check_admin_permission(current_user)
+
+    # Validate query parameters
+    query_params = user_query_schema.load(request.args.to_dict())
+
+    # Get users from service
+    result = UserService.get_users(
+        page=query_params["page"],
+        per_page=query_params["per_page"],
+        include_inactive=query_params["include_inactive"],
+        search=query_params.get("search"),
+        sort_by=query_params["sort_by"],
+        sort_order=query_params["sort_order"],
+    )
 
-        logger.info(
-            f"Retrieved {len(result['users'])} users (page {query_params['page']})"
-        )
+    logger.info(f"Retrieved {len(result['users'])} users (page {query_params['page']})")
 
-        return jsonify({"success": True, "data": result}), 200
-
-    except ValidationError as e:
-        return handle_validation_error(e)
-    except UserServiceError as e:
-        return handle_user_service_error(e)
-    except Exception as e:
-        logger.error(f"Unexpected error getting users: {e}")
-        return (
-            jsonify({"error": "Failed to retrieve users", "code": "INTERNAL_ERROR"}),
-            500,
-        )
+    return jsonify({"success": True, "data": result}), 200
 
 
 @user_bp.route("/<int:user_id>", methods=["GET"])
@@ -235,47 +279,36 @@ def get_user(user_id):
     """
     logger.info(f"Get user request received for ID: {user_id}")
 
-    try:
-        # Get current user and check permissions
-        current_user = get_current_user()
+    # Get current user and check permissions
+    current_user = get_current_user()
 
-        if not check_user_access_permission(current_user, user_id):
-            raise UserServiceError(
-                "Insufficient permissions to access this user",
-                code="INSUFFICIENT_PERMISSIONS",
-                status_code=403,
-            )
-
-        # Get user from service
-        user = UserService.get_user_by_id(
-            user_id, include_inactive=current_user.is_admin
+    if not check_user_access_permission(current_user, user_id):
+        raise UserServiceError(
+            "Insufficient permissions to access this user",
+            code="INSUFFICIENT_PERMISSIONS",
+            status_code=403,
         )
 
-        if not user:
-            raise UserServiceError(
-                "User not found", code="USER_NOT_FOUND", status_code=404
-            )
-
-        logger.info(f"User retrieved: {user.username}")
-
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "data": {"user": user.to_dict(exclude_fields=["password_hash"])},
-                }
-            ),
-            200,
-        )
+    # Get user from service
+    user = UserService.get_user_by_id(user_id, include_inactive=current_user.is_admin)
 
-    except UserServiceError as e:
-        return handle_user_service_error(e)
-    except Exception as e:
-        logger.error(f"Unexpected error getting user {user_id}: {e}")
-        return (
-            jsonify({"error": "Failed to retrieve user", "code": "INTERNAL_ERROR"}),
-            500,
-        )
+    if not user:
+        raise UserServiceError("User not found", code="USER_NOT_FOUND", status_code=404)
+
+    # Skip serialization when the client already has this version
+    etag = user_etag(user)
+    if request.if_none_match.contains_weak(etag):
+        return set_cache_validators(Response(status=304), etag)
+
+    logger.info(f"User retrieved: {user.username}")
+
+    response = jsonify(
+        {
+            "success": True,
+            "data": {"user": user.to_dict(exclude_fields=["password_hash"])},
+        }
+    )
+    return set_cache_validators(response, etag), 200
 
 
 @user_bp.route("", methods=["POST"])
@@ -309,50 +342,37 @@ def create_user():
     """
     logger.info("Create user request received")
 
-    try:
-        # Get current user and check permissions
-        current_user = get_current_user()
-        check_admin_permission(current_user)
-
-        # Validate request data
-        schema = CreateUserRequestSchema()
-        data = schema.load(request.get_json() or {})
-
-        # Create user
-        user = UserService.create_user(
-            username=data["username"],
-            email=data["email"],
-            password=data.get("password"),
-            first_name=data.get("first_name"),
-            last_name=data.get("last_name"),
-            is_admin=data.get("is_admin", False),
-            is_verified=data.get("is_verified", False),
-            created_by_user=current_user,
-        )
+    # Get current user and check permissions
+    current_user = get_current_user()
+    check_admin_permission(current_user)
+
+    # Validate request data
+    data = create_user_request_schema.load(request.get_json() or {})
+
+    # Create user
+    user = UserService.create_user(
+        username=data["username"],
+        email=data["email"],
+        password=data.get("password"),
+        first_name=data.get("first_name"),
+        last_name=data.get("last_name"),
+        is_admin=data.get("is_admin", False),
+        is_verified=data.get("is_verified", False),
+        created_by_user=current_user,
+    )
 
-        logger.info(f"User created: {user.username} by {current_user.username}")
-
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "message": "User created successfully",
-                    "data": {"user": user.to_dict(exclude_fields=["password_hash"])},
-                }
-            ),
-            201,
-        )
+    logger.info(f"User created: {user.username} by {current_user.username}")
 
-    except ValidationError as e:
-        return handle_validation_error(e)
-    except UserServiceError as e:
-        return handle_user_service_error(e)
-    except Exception as e:
-        logger.error(f"Unexpected error creating user: {e}")
-        return (
-            jsonify({"error": "Failed to create user", "code": "INTERNAL_ERROR"}),
-            500,
-        )
+    return (
+        jsonify(
+            {
+                "success": True,
+                "message": "User created successfully",
+                "data": {"user": user.to_dict(exclude_fields=["password_hash"])},
+            }
+        ),
+        201,
+    )
 
 
 @user_bp.route("/<int:user_id>", methods=["PUT"])
@@ -391,56 +411,40 @@ def update_user(user_id):
     """
     logger.info(f"Update user request received for ID: {user_id}")
 
-    try:
-        # Get current user and check permissions
-        current_user = get_current_user()
-
-        if not check_user_access_permission(current_user, user_id):
-            raise UserServiceError(
-                "Insufficient permissions to update this user",
-                code="INSUFFICIENT_PERMISSIONS",
-                status_code=403,
-            )
-
-        # Validate request data
-        schema = UpdateUserRequestSchema()
-        data = schema.load(request.get_json() or {})
-
-        # Filter admin-only fields for non-admin users
-        if not current_user.is_admin:
-            admin_only_fields = ["is_active", "is_verified", "is_admin"]
-            for field in admin_only_fields:
-                if field in data:
-                    del data[field]
-
-        # Update user
-        user = UserService.update_user(
-            user_id=user_id, update_data=data, updated_by_user=current_user
-        )
+    # Get current user and check permissions
+    current_user = get_current_user()
 
-        logger.info(f"User updated: {user.username} by {current_user.username}")
-
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "message": "User updated successfully",
-                    "data": {"user": user.to_dict(exclude_fields=["password_hash"])},
-                }
-            ),
-            200,
+    if not check_user_access_permission(current_user, user_id):
+        raise UserServiceError(
+            "Insufficient permissions to update this user",
+            code="INSUFFICIENT_PERMISSIONS",
+            status_code=403,
         )
 
-    except ValidationError as e:
-        return handle_validation_error(e)
-    except UserServiceError as e:
-        return handle_user_service_error(e)
-    except Exception as e:
-        logger.error(f"Unexpected error updating user {user_id}: {e}")
-        return (
-            jsonify({"error": "Failed to update user", "code": "INTERNAL_ERROR"}),
-            500,
-        )
+    # Validate request data
+    data = update_user_request_schema.load(request.get_json() or {})
+
+    # Filter admin-only fields for non-admin users
+    if not current_user.is_admin:
+        data = {k: v for k, v in data.items() if k not in _ADMIN_ONLY_FIELDS}
+
+    # Update user
+    user = UserService.update_user(
+        user_id=user_id, update_data=data, updated_by_user=current_user
+    )
+
+    logger.info(f"User updated: {user.username} by {current_user.username}")
+
+    return (
+        jsonify(
+            {
+                "success": True,
+                "message": "User updated successfully",
+                "data": {"user": user.to_dict(exclude_fields=["password_hash"])},
+            }
+        ),
+        200,
+    )
 
 
 @user_bp.route("/<int:user_id>", methods=["DELETE"])
@@ -471,45 +475,33 @@ def delete_user(user_id):
     """
     logger.info(f"Delete user request received for ID: {user_id}")
 
-    try:
-        # Get current user and check permissions
-        current_user = get_current_user()
-        check_admin_permission(current_user)
+    # Get current user and check permissions
+    current_user = get_current_user()
+    check_admin_permission(current_user)
 
-        # Get query parameters
-        hard_delete = request.args.get("hard_delete", "false").lower() == "true"
-
-        # Delete user
-        result = UserService.delete_user(
-            user_id=user_id, deleted_by_user=current_user, soft_delete=not hard_delete
-        )
+    # Get query parameters
+    hard_delete = request.args.get("hard_delete", "false").lower() == "true"
 
-        logger.info(
-            f"User deleted (hard_delete={hard_delete}) by {current_user.username}"
-        )
+    # Delete user
+    result = UserService.delete_user(
+        user_id=user_id, deleted_by_user=current_user, soft_delete=not hard_delete
+    )
 
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "message": result["message"],
-                    "data": {
-                        "user_id": result["user_id"],
-                        "soft_delete": result["soft_delete"],
-                    },
-                }
-            ),
-            200,
-        )
+    logger.info(f"User deleted (hard_delete={hard_delete}) by {current_user.username}")
 
-    except UserServiceError as e:
-        return handle_user_service_error(e)
-    except Exception as e:
-        logger.error(f"Unexpected error deleting user {user_id}: {e}")
-        return (
-            jsonify({"error": "Failed to delete user", "code": "INTERNAL_ERROR"}),
-            500,
-        )
+    return (
+        jsonify(
+            {
+                "success": True,
+                "message": result["message"],
+                "data": {
+                    "user_id": result["user_id"],
+                    "soft_delete": result["soft_delete"],
+                },
+            }
+        ),
+        200,
+    )
 
 
 @user_bp.route("/<int:user_id>/activate", methods=["POST"])
@@ -536,37 +528,25 @@ def activate_user(user_id):
     """
     logger.info(f"Activate user request received for ID: {user_id}")
 
-    try:
-        # Get current user and check permissions
-        current_user = get_current_user()
-        check_admin_permission(current_user)
+    # Get current user and check permissions
+    current_user = get_current_user()
+    check_admin_permission(current_user)
 
-        # Activate user
-        user = UserService.activate_user(
-            user_id=user_id, activated_by_user=current_user
-        )
+    # Activate user
+    user = UserService.activate_user(user_id=user_id, activated_by_user=current_user)
 
-        logger.info(f"User activated: {user.username} by {current_user.username}")
-
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "message": "User activated successfully",
-                    "data": {"user": user.to_dict(exclude_fields=["password_hash"])},
-                }
-            ),
-            200,
-        )
+    logger.info(f"User activated: {user.username} by {current_user.username}")
 
-    except UserServiceError as e:
-        return handle_user_service_error(e)
-    except Exception as e:
-        logger.error(f"Unexpected error activating user {user_id}: {e}")
-        return (
-            jsonify({"error": "Failed to activate user", "code": "INTERNAL_ERROR"}),
-            500,
-        )
+    return (
+        jsonify(
+            {
+                "success": True,
+                "message": "User activated successfully",
+                "data": {"user": user.to_dict(exclude_fields=["password_hash"])},
+            }
+        ),
+        200,
+    )
 
 
 @user_bp.route("/<int:user_id>/deactivate", methods=["POST"])
@@ -594,37 +574,27 @@ def deactivate_user(user_id):
     """
     logger.info(f"Deactivate user request received for ID: {user_id}")
 
-    try:
-        # Get current user and check permissions
-        current_user = get_current_user()
-        check_admin_permission(current_user)
+    # Get current user and check permissions
+    current_user = get_current_user()
+    check_admin_permission(current_user)
 
-        # Deactivate user
-        user = UserService.deactivate_user(
-            user_id=user_id, deactivated_by_user=current_user
-        )
+    # Deactivate user
+    user = UserService.deactivate_user(
+        user_id=user_id, deactivated_by_user=current_user
+    )
 
-        logger.info(f"User deactivated: {user.username} by {current_user.username}")
-
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "message": "User deactivated successfully",
-                    "data": {"user": user.to_dict(exclude_fields=["password_hash"])},
-                }
-            ),
-            200,
-        )
+    logger.info(f"User deactivated: {user.username} by {current_user.username}")
 
-    except UserServiceError as e:
-        return handle_user_service_error(e)
-    except Exception as e:
-        logger.error(f"Unexpected error deactivating user {user_id}: {e}")
-        return (
-            jsonify({"error": "Failed to deactivate user", "code": "INTERNAL_ERROR"}),
-            500,
-        )
+    return (
+        jsonify(
+            {
+                "success": True,
+                "message": "User deactivated successfully",
+                "data": {"user": user.to_dict(exclude_fields=["password_hash"])},
+            }
+        ),
+        200,
+    )
 
 
 @user_bp.route("/<int:user_id>/unlock", methods=["POST"])
@@ -651,39 +621,27 @@ def unlock_user(user_id):
     """
     logger.info(f"Unlock user request received for ID: {user_id}")
 
-    try:
-        # Get current user and check permissions
-        current_user = get_current_user()
-        check_admin_permission(current_user)
+    # Get current user and check permissions
+    current_user = get_current_user()
+    check_admin_permission(current_user)
 
-        # Unlock user
-        user = UserService.unlock_user_account(
-            user_id=user_id, unlocked_by_user=current_user
-        )
+    # Unlock user
+    user = UserService.unlock_user_account(
+        user_id=user_id, unlocked_by_user=current_user
+    )
 
-        logger.info(f"User unlocked: {user.username} by {current_user.username}")
-
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "message": "User account unlocked successfully",
-                    "data": {"user": user.to_dict(exclude_fields=["password_hash"])},
-                }
-            ),
-            200,
-        )
+    logger.info(f"User unlocked: {user.username} by {current_user.username}")
 
-    except UserServiceError as e:
-        return handle_user_service_error(e)
-    except Exception as e:
-        logger.error(f"Unexpected error unlocking user {user_id}: {e}")
-        return (
-            jsonify(
-                {"error": "Failed to unlock user account", "code": "INTERNAL_ERROR"}
-            ),
-            500,
-        )
+    return (
+        jsonify(
+            {
+                "success": True,
+                "message": "User account unlocked successfully",
+                "data": {"user": user.to_dict(exclude_fields=["password_hash"])},
+            }
+        ),
+        200,
+    )
 
 
 @user_bp.route("/<int:user_id>/admin", methods=["POST"])
@@ -714,59 +672,47 @@ def set_admin_status(user_id):
     """
     logger.info(f"Set admin status request received for ID: {user_id}")
 
-    try:
-        # Get current user and check permissions
-        current_user = get_current_user()
-        check_admin_permission(current_user)
-
-        # Validate request data
-        data = request.get_json() or {}
-        if "is_admin" not in data:
-            raise UserServiceError(
-                "is_admin field is required",
-                code="MISSING_REQUIRED_FIELD",
-                status_code=400,
-            )
-
-        is_admin = data["is_admin"]
-        if not isinstance(is_admin, bool):
-            raise UserServiceError(
-                "is_admin must be a boolean value",
-                code="INVALID_FIELD_TYPE",
-                status_code=400,
-            )
-
-        # Set admin status
-        user = UserService.set_user_admin_status(
-            user_id=user_id, is_admin=is_admin, updated_by_user=current_user
-        )
+    # Get current user and check permissions
+    current_user = get_current_user()
+    check_admin_permission(current_user)
 
-        status = "granted" if is_admin else "revoked"
-        logger.info(
-            f"Admin privileges {status} for user: {user.username} by {current_user.username}"
+    # Validate request data
+    data = request.get_json() or {}
+    if "is_admin" not in data:
+        raise UserServiceError(
+            "is_admin field is required",
+            code="MISSING_REQUIRED_FIELD",
+            status_code=400,
         )
 
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "message": f"Admin privileges {status} successfully",
-                    "data": {"user": user.to_dict(exclude_fields=["password_hash"])},
-                }
-            ),
-            200,
+    is_admin = data["is_admin"]
+    if not isinstance(is_admin, bool):
+        raise UserServiceError(
+            "is_admin must be a boolean value",
+            code="INVALID_FIELD_TYPE",
+            status_code=400,
         )
 
-    except UserServiceError as e:
-        return handle_user_service_error(e)
-    except Exception as e:
-        logger.error(f"Unexpected error setting admin status for user {user_id}: {e}")
-        return (
-            jsonify(
-                {"error": "Failed to update admin status", "code": "INTERNAL_ERROR"}
-            ),
-            500,
-        )
+    # Set admin status
+    user = UserService.set_user_admin_status(
+        user_id=user_id, is_admin=is_admin, updated_by_user=current_user
+    )
+
+    status = "granted" if is_admin else "revoked"
+    logger.info(
+        f"Admin privileges {status} for user: {user.username} by {current_user.username}"
+    )
+
+    return (
+        jsonify(
+            {
+                "success": True,
+                "message": f"Admin privileges {status} successfully",
+                "data": {"user": user.to_dict(exclude_fields=["password_hash"])},
+            }
+        ),
+        200,
+    )
 
 
 @user_bp.route("/search", methods=["GET"])
@@ -795,53 +741,41 @@ def search_users():
     """
     logger.info("Search users request received")
 
-    try:
-        # Get current user and check permissions
-        current_user = get_current_user()
-        check_admin_permission(current_user)
+    # Get current user and check permissions
+    current_user = get_current_user()
+    check_admin_permission(current_user)
 
-        # Validate query parameters
-        schema = UserSearchSchema()
-        query_params = schema.load(request.args.to_dict())
+    # Validate query parameters
+    query_params = user_search_schema.load(request.args.to_dict())
 
-        # Search users
-        users = UserService.search_users(
-            search_term=query_params["q"],
-            limit=query_params["limit"],
-            include_inactive=query_params["include_inactive"],
-        )
-
-        # Convert to dictionaries
-        users_data = [user.to_dict(exclude_fields=["password_hash"]) for user in users]
+    # Search users
+    users = UserService.search_users(
+        search_term=query_params["q"],
+        limit=query_params["limit"],
+        include_inactive=query_params["include_inactive"],
+        prefix_only=query_params["prefix"],
+    )
 
-        logger.info(
-            f"Search completed: found {len(users_data)} users for term '{query_params['q']}'"
-        )
+    # Convert to dictionaries
+    users_data = [user.to_dict(exclude_fields=["password_hash"]) for user in users]
 
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "data": {
-                        "users": users_data,
-                        "search_term": query_params["q"],
-                        "total_results": len(users_data),
-                    },
-                }
-            ),
-            200,
-        )
+    logger.info(
+        f"Search completed: found {len(users_data)} users for term '{query_params['q']}'"
+    )
 
-    except ValidationError as e:
-        return handle_validation_error(e)
-    except UserServiceError as e:
-        return handle_user_service_error(e)
-    except Exception as e:
-        logger.error(f"Unexpected error searching users: {e}")
-        return (
-            jsonify({"error": "Failed to search users", "code": "INTERNAL_ERROR"}),
-            500,
-        )
+    return (
+        jsonify(
+            {
+                "success": True,
+                "data": {
+                    "users": users_data,
+                    "search_term": query_params["q"],
+                    "total_results": len(users_data),
+                },
+            }
+        ),
+        200,
+    )
 
 
 @user_bp.route("/statistics", methods=["GET"])
@@ -864,31 +798,22 @@ def get_user_statistics():
     """
     logger.info("Get user statistics request received")
 
-    try:
-        # Get current user and check permissions
-        current_user = get_current_user()
-        check_admin_permission(current_user)
-
-        # Get statistics
-        stats = UserService.get_user_statistics()
-
-        logger.info("User statistics retrieved successfully")
-
-        return jsonify({"success": True, "data": {"statistics": stats}}), 200
-
-    except UserServiceError as e:
-        return handle_user_service_error(e)
-    except Exception as e:
-        logger.error(f"Unexpected error getting user statistics: {e}")
-        return (
-            jsonify(
-                {
-                    "error": "Failed to retrieve user statistics",
-                    "code": "INTERNAL_ERROR",
-                }
-            ),
-            500,
-        )
+    # Get current user and check permissions
+    current_user = get_current_user()
+    check_admin_permission(current_user)
+
+    # Get statistics
+    stats = UserService.get_user_statistics()
+
+    # Skip serialization when the client already has these figures
+    etag = statistics_etag(stats)
+    if request.if_none_match.contains_weak(etag):
+        return set_cache_validators(Response(status=304), etag)
+
+    logger.info("User statistics retrieved successfully")
+
+    response = jsonify({"success": True, "data": {"statistics": stats}})
+    return set_cache_validators(response, etag), 200
 
 
 # Error handlers for the blueprint
@@ -907,17 +832,17 @@ def handle_user_service_error_handler(error):
 @user_bp.errorhandler(404)
 def handle_not_found(error):
     """Handle 404 errors."""
-    return jsonify({"error": "Endpoint not found", "code": "NOT_FOUND"}), 404
+    return Response(_NOT_FOUND_BODY, 404, mimetype="application/json")
 
 
 @user_bp.errorhandler(405)
 def handle_method_not_allowed(error):
     """Handle 405 errors."""
-    return jsonify({"error": "Method not allowed", "code": "METHOD_NOT_ALLOWED"}), 405
+    return Response(_METHOD_NOT_ALLOWED_BODY, 405, mimetype="application/json")
 
 
 @user_bp.errorhandler(500)
 def handle_internal_error(error):
     """Handle 500 errors."""
     logger.error(f"Internal server error in user controller: {error}")
-    return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR"}), 500
+    return Response(_INTERNAL_ERROR_BODY, 500, mimetype="application/json")
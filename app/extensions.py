@@ -6,12 +6,20 @@ Extensions are initialized here to avoid circular imports.
 """
 
 import logging
+import threading
+import time
+from datetime import datetime
 
+from cachetools import TTLCache
+from flask import request
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from flask_migrate import Migrate
 from flask_restx import Api
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached, undefer
+from sqlalchemy.orm.attributes import set_committed_value
 
 # Initialize extensions
 db = SQLAlchemy()
@@ -23,6 +31,20 @@ api = Api()
 # Logger for extensions
 logger = logging.getLogger(__name__)
 
+# Column values of authenticated users keyed by (identity, jti), shared
+# across requests. Only plain data is stored; each request builds its own
+# session-bound instance from it.
+_user_cache = TTLCache(maxsize=10000, ttl=30)
+_user_cache_lock = threading.Lock()
+
+# Whether the lookup cache is used; set from JWT_USER_CACHE_ENABLED when the
+# JWT callbacks are configured so requests don't read the config.
+_user_cache_enabled = True
+
+# Endpoints that check the current user's password. Their user lookups skip
+# the cache and load the deferred password hash in the same query.
+_PASSWORD_ENDPOINTS = frozenset(("auth.change_password",))
+
 
 def init_extensions(app):
     """
@@ -94,6 +116,8 @@ def configure_jwt_callbacks(app):
     Args:
         app (Flask): Flask application instance
     """
+    global _user_cache_enabled
+    _user_cache_enabled = app.config.get("JWT_USER_CACHE_ENABLED", True)
 
     @jwt.expired_token_loader
     def expired_token_callback(jwt_header, jwt_payload):
@@ -157,9 +181,10 @@ def configure_jwt_callbacks(app):
         Returns:
             User identity (typically user ID)
         """
-        if hasattr(user, "id"):
+        try:
             return user.id
-        return user
+        except AttributeError:
+            return user
 
     @jwt.user_lookup_loader
     def user_lookup_callback(_jwt_header, jwt_data):
@@ -175,13 +200,34 @@ def configure_jwt_callbacks(app):
         """
         from app.models.user import User
 
-        identity = jwt_data["sub"]
+        identity = str(jwt_data["sub"])
+        key = (identity, jwt_data.get("jti"))
+        with_password = request.endpoint in _PASSWORD_ENDPOINTS
+        use_cache = _user_cache_enabled and not with_password
+
+        if use_cache:
+            with _user_cache_lock:
+                cached = _user_cache.get(key)
+            if cached is not None:
+                if _is_user_allowed(cached["is_active"], cached["locked_until"]):
+                    return _user_from_cache(User, cached)
+                evict_cached_user(identity, key[1])
+                return None
+
         logger.debug(f"Looking up user with identity: {identity}")
 
         try:
             # Identity should be the user ID
-            user = User.get_by_id(int(identity))
-            if user and user.is_active and not user.is_account_locked():
+            if with_password:
+                user = db.session.get(
+                    User, int(identity), options=[undefer(User.password_hash)]
+                )
+            else:
+                user = User.get_by_id(int(identity))
+            if user and _is_user_allowed(user.is_active, user.locked_until):
+                if use_cache:
+                    with _user_cache_lock:
+                        _user_cache[key] = _user_cache_entry(user)
                 return user
             else:
                 logger.warning(
@@ -196,6 +242,81 @@ def configure_jwt_callbacks(app):
             return None
 
 
+def _is_user_allowed(is_active, locked_until):
+    """
+    Check whether a user may authenticate, without modifying the user.
+
+    An expired lock counts as unlocked; it is cleared on the next login.
+
+    Args:
+        is_active (bool): User's is_active flag
+        locked_until (datetime, optional): User's locked_until column
+
+    Returns:
+        bool: True if the user is active and not locked
+    """
+    return bool(is_active) and (
+        locked_until is None or locked_until <= datetime.utcnow()
+    )
+
+
+def _user_cache_entry(user):
+    """
+    Snapshot the loaded column values of a user for the lookup cache.
+
+    Deferred columns (such as the password hash) are never cached.
+
+    Args:
+        user (User): Freshly loaded, unmodified user
+
+    Returns:
+        dict: Column values keyed by attribute name
+    """
+    state = inspect(user)
+    return {
+        attr.key: state.dict[attr.key]
+        for attr in state.mapper.column_attrs
+        if not attr.deferred and attr.key in state.dict
+    }
+
+
+def _user_from_cache(model, data):
+    """
+    Build a session-bound user from cached column values without querying.
+
+    Columns missing from the cache (deferred ones) load on first access.
+
+    Args:
+        model: User model class
+        data (dict): Result of _user_cache_entry
+
+    Returns:
+        User: Clean persistent instance in the current session
+    """
+    user = model.__mapper__.class_manager.new_instance()
+    for name, value in data.items():
+        set_committed_value(user, name, value)
+    make_transient_to_detached(user)
+    return db.session.merge(user, load=False)
+
+
+def evict_cached_user(identity, jti=None):
+    """
+    Remove cached JWT user lookups so the next request hits the database.
+
+    Args:
+        identity: User identity (JWT ``sub``) to evict
+        jti (str, optional): Evict only this token; all tokens if omitted
+    """
+    identity = str(identity)
+    with _user_cache_lock:
+        if jti is not None:
+            _user_cache.pop((identity, jti), None)
+            return
+        for key in [key for key in _user_cache if key[0] == identity]:
+            _user_cache.pop(key, None)
+
+
 def configure_database_events(app):
     """
     Configure SQLAlchemy database event listeners.
@@ -205,27 +326,65 @@ def configure_database_events(app):
     """
     from sqlalchemy import event
 
+    # Decide once which listeners are needed so disabled features add no
+    # per-connection or per-statement overhead
+    is_sqlite = "sqlite" in app.config.get("SQLALCHEMY_DATABASE_URI", "")
+    slow_query_ms = app.config.get("SLOW_QUERY_THRESHOLD_MS", 100)
+
     # Use app context to access the engine
     with app.app_context():
-
-        @event.listens_for(db.engine, "connect")
-        def set_sqlite_pragma(dbapi_connection, connection_record):
-            """Enable foreign key constraints for SQLite."""
-            if "sqlite" in app.config.get("SQLALCHEMY_DATABASE_URI", ""):
+        engine = db.engine
+
+        @event.listens_for(engine, "handle_error")
+        def log_database_error(exception_context):
+            """Log failed statements once, for every query helper."""
+            logger.error(
+                "Database error: %s | statement: %.500s",
+                exception_context.original_exception,
+                exception_context.statement,
+            )
+
+        if is_sqlite:
+
+            @event.listens_for(engine, "connect")
+            def set_sqlite_pragma(dbapi_connection, connection_record):
+                """Enable foreign key constraints for SQLite."""
                 cursor = dbapi_connection.cursor()
                 cursor.execute("PRAGMA foreign_keys=ON")
                 cursor.close()
                 logger.debug("SQLite foreign key constraints enabled")
 
-        @event.listens_for(db.engine, "before_cursor_execute")
-        def receive_before_cursor_execute(
-            conn, cursor, statement, parameters, context, executemany
-        ):
-            """Log SQL queries in debug mode."""
-            if app.debug and app.config.get("LOG_LEVEL") == "DEBUG":
-                logger.debug(f"SQL Query: {statement}")
-                if parameters:
-                    logger.debug(f"Parameters: {parameters}")
+        if slow_query_ms:
+            slow_query_seconds = slow_query_ms / 1000.0
+
+            @event.listens_for(engine, "before_cursor_execute")
+            def receive_before_cursor_execute(
+                conn, cursor, statement, parameters, context, executemany
+            ):
+                """Record query start time (stacked to handle nested execution)."""
+                conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+            @event.listens_for(engine, "after_cursor_execute")
+            def receive_after_cursor_execute(
+                conn, cursor, statement, parameters, context, executemany
+            ):
+                """Log queries slower than SLOW_QUERY_THRESHOLD_MS."""
+                duration = time.perf_counter() - conn.info["query_start_time"].pop()
+                if duration > slow_query_seconds:
+                    logger.warning(
+                        "[WARNING] Slow query (%.1f ms): %.500s",
+                        duration * 1000,
+                        statement,
+                    )
+
+            @event.listens_for(engine, "handle_error")
+            def receive_handle_error(exception_context):
+                """Discard the start time of a statement that failed."""
+                connection = exception_context.connection
+                if connection is not None:
+                    start_times = connection.info.get("query_start_time")
+                    if start_times:
+                        start_times.pop()
 
     logger.info("Database event listeners configured")
 
@@ -13,6 +13,7 @@ from .auth_middleware import (
     require_auth,
     require_roles,
 )
+from .combined import CombinedMiddleware, combined_middleware
 from .logging_middleware import (
     LoggingMiddleware,
     PerformanceMiddleware,
@@ -32,4 +33,6 @@ __all__ = [
     "PerformanceMiddleware",
     "logging_middleware",
     "performance_middleware",
+    "CombinedMiddleware",
+    "combined_middleware",
 ]
@@ -6,6 +6,7 @@ error handling for protected routes.
 """
 
 import logging
+import re
 from functools import wraps
 
 from flask import current_app, g, jsonify, request
@@ -19,6 +20,12 @@ from werkzeug.exceptions import Unauthorized
 
 logger = logging.getLogger(__name__)
 
+# Paths that never require authentication, matched as whole path segments
+_SKIP_AUTH_RE = re.compile(
+    r"^(?:/health|/docs|/swagger|/openapi\.json|/auth/(?:login|register|refresh))"
+    r"(?:/|$)"
+)
+
 
 class AuthenticationMiddleware:
     """
@@ -36,16 +43,19 @@ class AuthenticationMiddleware:
         if app is not None:
             self.init_app(app)
 
-    def init_app(self, app):
+    def init_app(self, app, register_hooks=True):
         """
         Initialize middleware with Flask application.
 
         Args:
             app (Flask): Flask application instance
+            register_hooks (bool): Register request hooks on the app; False when
+                driven by CombinedMiddleware
         """
         self.app = app
-        app.before_request(self.before_request)
-        app.after_request(self.after_request)
+        if register_hooks:
+            app.before_request(self.before_request)
+            app.teardown_request(self.teardown_request)
         logger.info("Authentication middleware initialized")
 
     def before_request(self):
@@ -74,23 +84,15 @@ class AuthenticationMiddleware:
             # Let JWT extension handle the error response
             pass
 
-    def after_request(self, response):
+    def teardown_request(self, exception=None):
         """
-        Process response after route handler execution.
+        Clear user context at the end of the request, including error paths.
 
         Args:
-            response: Flask response object
-
-        Returns:
-            Flask response object
+            exception: Exception that occurred during request processing
         """
-        # Clear user context after request
-        if hasattr(g, "current_user"):
-            delattr(g, "current_user")
-        if hasattr(g, "current_user_id"):
-            delattr(g, "current_user_id")
-
-        return response
+        g.pop("current_user", None)
+        g.pop("current_user_id", None)
 
     def _should_skip_auth(self):
         """
@@ -99,27 +101,16 @@ class AuthenticationMiddleware:
         Returns:
             bool: True if authentication should be skipped
         """
-        # Skip authentication for certain endpoints
-        skip_endpoints = [
-            "/health",
-            "/docs",
-            "/swagger",
-            "/openapi.json",
-            "/auth/login",
-            "/auth/register",
-            "/auth/refresh",
-        ]
-
         # Skip for OPTIONS requests (CORS preflight)
         if request.method == "OPTIONS":
             return True
 
-        # Skip for specific endpoints
-        for endpoint in skip_endpoints:
-            if request.path.startswith(endpoint):
-                return True
-
-        return False
+        # Routes are flagged once at startup; fall back to the pattern for
+        # unmatched paths and rules added afterwards
+        skip = getattr(request.url_rule, "skip_auth", None)
+        if skip is None:
+            skip = _SKIP_AUTH_RE.match(request.path) is not None
+        return skip
 
     def _setup_user_context(self, user_identity):
         """
@@ -203,6 +194,8 @@ def require_roles(*required_roles):
         Decorated function
     """
 
+    required = frozenset(required_roles)
+
     def decorator(f):
         @wraps(f)
         @require_auth()
@@ -212,7 +205,7 @@ def require_roles(*required_roles):
                 user_roles = jwt_claims.get("roles", [])
 
                 # Check if user has any of the required roles
-                if not any(role in user_roles for role in required_roles):
+                if required.isdisjoint(user_roles):
                     logger.warning(
                         f"Access denied. Required roles: {required_roles}, User roles: {user_roles}"
                     )
@@ -0,0 +1,101 @@
+"""
+Combined middleware that drives logging, performance and authentication hooks.
+
+Registering each middleware separately makes Flask dispatch through three
+before_request and three after_request callbacks per request. This module
+registers a single pair of hooks and runs the individual middleware stages
+inline, in the same order the separate registrations produced.
+"""
+
+import logging
+
+from .auth_middleware import _SKIP_AUTH_RE, auth_middleware
+from .logging_middleware import _SKIP_LOG_RE, logging_middleware, performance_middleware
+
+logger = logging.getLogger(__name__)
+
+
+class CombinedMiddleware:
+    """
+    Single-hook middleware running logging, performance and auth stages.
+    """
+
+    def __init__(self, app=None, logging_mw=None, performance_mw=None, auth_mw=None):
+        """
+        Initialize combined middleware.
+
+        Args:
+            app (Flask, optional): Flask application instance
+            logging_mw (LoggingMiddleware, optional): Logging stage
+            performance_mw (PerformanceMiddleware, optional): Performance stage
+            auth_mw (AuthenticationMiddleware, optional): Authentication stage
+        """
+        self.app = app
+        self.logging = logging_mw or logging_middleware
+        self.performance = performance_mw or performance_middleware
+        self.auth = auth_mw or auth_middleware
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """
+        Initialize middleware with Flask application.
+
+        Args:
+            app (Flask): Flask application instance
+        """
+        self.app = app
+        self.logging.init_app(app, register_hooks=False)
+        self.performance.init_app(app, register_hooks=False)
+        self.auth.init_app(app, register_hooks=False)
+
+        app.before_request(self.before_request)
+        app.after_request(self.after_request)
+        app.teardown_request(self.auth.teardown_request)
+        app.teardown_appcontext(self.logging.teardown_request)
+        logger.info("Combined middleware initialized")
+
+    def mark_skip_rules(self, app):
+        """
+        Flag URL rules that bypass authentication or request logging.
+
+        Must run after all blueprints and API namespaces are registered. The
+        middleware then reads one attribute from ``request.url_rule`` instead
+        of matching the path on every request.
+
+        Args:
+            app (Flask): Flask application instance
+        """
+        for rule in app.url_map.iter_rules():
+            rule.skip_auth = _SKIP_AUTH_RE.match(rule.rule) is not None
+            rule.skip_logging = _SKIP_LOG_RE.match(rule.rule) is not None
+
+    def before_request(self):
+        """
+        Run request logging, then authentication context setup.
+
+        The logging stage records ``g.start_time``, so the performance stage
+        has nothing to do before the request.
+        """
+        self.logging.before_request()
+        self.auth.before_request()
+
+    def after_request(self, response):
+        """
+        Run performance metrics and response logging.
+
+        Auth context cleanup happens in teardown_request so it also runs when
+        the request fails.
+
+        Args:
+            response: Flask response object
+
+        Returns:
+            Flask response object
+        """
+        response = self.performance.after_request(response)
+        return self.logging.after_request(response)
+
+
+# Create middleware instance
+combined_middleware = CombinedMiddleware()
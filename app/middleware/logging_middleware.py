@@ -5,16 +5,128 @@ This middleware provides structured logging, request/response tracking, and perf
 monitoring capabilities for the Flask API.
 """
 
-import json
+import itertools
 import logging
+import os
+import random
+import re
+import threading
 import time
 from datetime import datetime
 
+import orjson
 from flask import current_app, g, request
 from werkzeug.exceptions import HTTPException
 
 logger = logging.getLogger(__name__)
 
+# Paths excluded from request/response logging
+_SKIP_LOG_RE = re.compile(r"^(?:/health(?:/|$)|/favicon\.ico$|/static/)")
+
+# Methods whose JSON body is included in request logs
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Lowercased header names whose values are redacted from logs
+_SENSITIVE_HEADERS = frozenset({"authorization", "cookie", "x-api-key", "x-auth-token"})
+
+# Request IDs are "<pid>-<sequence>" in hex; reset in forked workers so each
+# worker process gets its own prefix
+_request_id_prefix = f"{os.getpid():x}-"
+_request_id_counter = itertools.count(1)
+
+
+def _reset_request_ids():
+    """
+    Restart request ID generation for the current process.
+    """
+    global _request_id_prefix, _request_id_counter
+
+    _request_id_prefix = f"{os.getpid():x}-"
+    _request_id_counter = itertools.count(1)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_request_ids)
+
+
+def _request_timestamp():
+    """
+    Get the ISO timestamp shared by all log entries of the current request.
+
+    Computed on first use and stored on ``g``, so requests that log nothing
+    never build it.
+
+    Returns:
+        str: UTC timestamp in ISO 8601 format
+    """
+    timestamp = g.get("request_timestamp")
+    if timestamp is None:
+        timestamp = g.request_timestamp = datetime.utcnow().isoformat()
+    return timestamp
+
+
+class _LazyMapping:
+    """
+    Defer copying a request/response mapping until the log payload is dumped.
+    """
+
+    __slots__ = ("source", "redact")
+
+    def __init__(self, source, redact=False):
+        """
+        Wrap a mapping for lazy serialization.
+
+        Args:
+            source: Mapping such as ``request.headers`` or ``request.args``
+            redact (bool): Replace values of sensitive header names
+        """
+        self.source = source
+        self.redact = redact
+
+    def materialize(self):
+        """
+        Copy the wrapped mapping into a plain dict.
+
+        Returns:
+            dict: Mapping contents, with sensitive values redacted if requested
+        """
+        if not self.redact:
+            return dict(self.source.items())
+        return {
+            key: "[REDACTED]" if key.lower() in _SENSITIVE_HEADERS else value
+            for key, value in self.source.items()
+        }
+
+
+def _default(obj):
+    """
+    Convert values orjson cannot serialize natively.
+
+    Args:
+        obj: Value to convert
+
+    Returns:
+        Serializable representation of ``obj``
+    """
+    if isinstance(obj, _LazyMapping):
+        return obj.materialize()
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.decode("utf-8", "replace")
+    return str(obj)
+
+
+def _dumps(data):
+    """
+    Serialize a log payload to a JSON string.
+
+    Args:
+        data (dict): Payload to serialize
+
+    Returns:
+        str: JSON string, with unsupported values rendered via ``str()``
+    """
+    return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class LoggingMiddleware:
     """
@@ -29,20 +141,27 @@ class LoggingMiddleware:
             app (Flask, optional): Flask application instance
         """
         self.app = app
+        self.sample_rate = 1.0
+        self.slow_threshold = 1.0
         if app is not None:
             self.init_app(app)
 
-    def init_app(self, app):
+    def init_app(self, app, register_hooks=True):
         """
         Initialize middleware with Flask application.
 
         Args:
             app (Flask): Flask application instance
+            register_hooks (bool): Register request hooks on the app; False when
+                driven by CombinedMiddleware
         """
         self.app = app
-        app.before_request(self.before_request)
-        app.after_request(self.after_request)
-        app.teardown_appcontext(self.teardown_request)
+        self.sample_rate = app.config.get("LOG_SAMPLE_RATE", 1.0)
+        self.slow_threshold = app.config.get("SLOW_REQUEST_THRESHOLD", 1.0)
+        if register_hooks:
+            app.before_request(self.before_request)
+            app.after_request(self.after_request)
+            app.teardown_appcontext(self.teardown_request)
         logger.info("Logging middleware initialized")
 
     def before_request(self):
@@ -50,9 +169,15 @@ class LoggingMiddleware:
         Process request before route handler execution.
         Records request start time and logs request details.
         """
-        # Record request start time
-        g.start_time = time.time()
+        # Record request start time (monotonic, for duration measurement)
+        g.start_time = time.perf_counter()
         g.request_id = self._generate_request_id()
+        g.request_timestamp = None  # filled in on first log entry
+
+        # Sample the successful-request firehose; errors and slow requests
+        # are always logged in full
+        sample_rate = self.sample_rate
+        g.log_sampled = sample_rate >= 1.0 or random.random() < sample_rate
 
         # Log request details
         self._log_request()
@@ -69,7 +194,8 @@ class LoggingMiddleware:
             Flask response object
         """
         # Calculate request duration
-        duration = time.time() - getattr(g, "start_time", time.time())
+        now = time.perf_counter()
+        duration = now - g.get("start_time", now)
 
         # Log response details
         self._log_response(response, duration)
@@ -97,47 +223,51 @@ class LoggingMiddleware:
         Returns:
             str: Unique request identifier
         """
-        import uuid
-
-        return str(uuid.uuid4())[:8]
+        return f"{_request_id_prefix}{next(_request_id_counter):x}"
 
     def _log_request(self):
         """
         Log structured request information.
         """
-        # Skip logging for health check and static files
-        if self._should_skip_logging():
+        # Skip logging for health check and static files, and avoid building
+        # the payload at all when INFO records would be discarded
+        if (
+            not g.get("log_sampled", True)
+            or not logger.isEnabledFor(logging.INFO)
+            or self._should_skip_logging()
+        ):
             return
 
+        # Resolve the request proxy once and reuse the underlying object
+        req = request._get_current_object()
+        method = req.method
+        headers = req.headers
+        content_length = req.content_length
+
         request_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _request_timestamp(),
             "request_id": getattr(g, "request_id", "unknown"),
-            "method": request.method,
-            "url": request.url,
-            "path": request.path,
-            "remote_addr": request.remote_addr,
-            "user_agent": request.headers.get("User-Agent", ""),
-            "content_type": request.content_type,
-            "content_length": request.content_length,
-            "args": dict(request.args),
-            "form": dict(request.form) if request.form else None,
-            "headers": dict(request.headers),
+            "method": method,
+            "url": req.url,
+            "path": req.path,
+            "remote_addr": req.remote_addr,
+            "user_agent": headers.get("User-Agent", ""),
+            "content_type": req.content_type,
+            "content_length": content_length,
+            "args": _LazyMapping(req.args),
+            "form": _LazyMapping(req.form) if req.form else None,
+            "headers": _LazyMapping(headers, redact=True),
         }
 
-        # Remove sensitive headers
-        self._sanitize_headers(request_data["headers"])
-
         # Log JSON body for POST/PUT requests (if not too large)
-        if request.method in ["POST", "PUT", "PATCH"] and request.is_json:
+        if method in _BODY_METHODS and req.is_json:
             try:
-                if (
-                    request.content_length and request.content_length < 10000
-                ):  # 10KB limit
-                    request_data["json"] = request.get_json()
+                if content_length and content_length < 10000:  # 10KB limit
+                    request_data["json"] = req.get_json()
             except Exception as e:
                 request_data["json_error"] = str(e)
 
-        logger.info(f"[INFO] REQUEST: {json.dumps(request_data, default=str)}")
+        logger.info("[INFO] REQUEST: %s", _dumps(request_data))
 
     def _log_response(self, response, duration):
         """
@@ -147,43 +277,45 @@ class LoggingMiddleware:
             response: Flask response object
             duration (float): Request processing duration in seconds
         """
-        # Skip logging for health check and static files
-        if self._should_skip_logging():
+        # Determine log level based on status code
+        status_code = response.status_code
+        if status_code >= 500:
+            level, label = logging.ERROR, "[ERROR]"
+        elif status_code >= 400:
+            level, label = logging.WARNING, "[WARNING]"
+        elif duration > self.slow_threshold or g.get("log_sampled", True):
+            level, label = logging.INFO, "[INFO]"
+        else:
+            return
+
+        # Skip logging for health check and static files, and avoid building
+        # the payload at all when the record would be discarded
+        if not logger.isEnabledFor(level) or self._should_skip_logging():
             return
 
         response_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _request_timestamp(),
             "request_id": getattr(g, "request_id", "unknown"),
-            "status_code": response.status_code,
+            "status_code": status_code,
             "status": response.status,
             "content_type": response.content_type,
             "content_length": response.content_length,
             "duration_ms": round(duration * 1000, 2),
-            "headers": dict(response.headers),
+            "headers": _LazyMapping(response.headers, redact=True),
         }
 
-        # Remove sensitive headers
-        self._sanitize_headers(response_data["headers"])
-
         # Log response body for errors (if not too large)
-        if response.status_code >= 400:
+        if status_code >= 400:
             try:
                 if (
                     response.content_length and response.content_length < 5000
                 ):  # 5KB limit
-                    response_data["data"] = response.get_data(as_text=True)
+                    # Raw bytes; decoded once while the payload is dumped
+                    response_data["data"] = response.get_data()
             except Exception as e:
                 response_data["data_error"] = str(e)
 
-        # Determine log level based on status code
-        if response.status_code >= 500:
-            logger.error(f"[ERROR] RESPONSE: {json.dumps(response_data, default=str)}")
-        elif response.status_code >= 400:
-            logger.warning(
-                f"[WARNING] RESPONSE: {json.dumps(response_data, default=str)}"
-            )
-        else:
-            logger.info(f"[INFO] RESPONSE: {json.dumps(response_data, default=str)}")
+        logger.log(level, "%s RESPONSE: %s", label, _dumps(response_data))
 
     def _log_exception(self, exception):
         """
@@ -195,7 +327,7 @@ class LoggingMiddleware:
         from flask import has_request_context
 
         exception_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _request_timestamp(),
             "request_id": getattr(g, "request_id", "unknown")
             if has_request_context()
             else "no-request",
@@ -205,11 +337,12 @@ class LoggingMiddleware:
 
         # Only add request-specific data if we're in a request context
         if has_request_context():
+            req = request._get_current_object()
             exception_data.update(
                 {
-                    "method": request.method,
-                    "path": request.path,
-                    "remote_addr": request.remote_addr,
+                    "method": req.method,
+                    "path": req.path,
+                    "remote_addr": req.remote_addr,
                 }
             )
         else:
@@ -219,12 +352,11 @@ class LoggingMiddleware:
 
         if isinstance(exception, HTTPException):
             exception_data["status_code"] = exception.code
-            logger.warning(
-                f"[WARNING] HTTP_EXCEPTION: {json.dumps(exception_data, default=str)}"
-            )
+            logger.warning("[WARNING] HTTP_EXCEPTION: %s", _dumps(exception_data))
         else:
             logger.error(
-                f"[ERROR] EXCEPTION: {json.dumps(exception_data, default=str)}",
+                "[ERROR] EXCEPTION: %s",
+                _dumps(exception_data),
                 exc_info=True,
             )
 
@@ -235,24 +367,12 @@ class LoggingMiddleware:
         Returns:
             bool: True if logging should be skipped
         """
-        skip_paths = ["/health", "/favicon.ico", "/static/"]
-        return any(request.path.startswith(path) for path in skip_paths)
-
-    def _sanitize_headers(self, headers):
-        """
-        Remove sensitive information from headers.
-
-        Args:
-            headers (dict): Headers dictionary to sanitize
-        """
-        sensitive_headers = ["authorization", "cookie", "x-api-key", "x-auth-token"]
-        for header in sensitive_headers:
-            if header in headers:
-                headers[header] = "[REDACTED]"
-            # Handle case-insensitive header names
-            for key in list(headers.keys()):
-                if key.lower() == header:
-                    headers[key] = "[REDACTED]"
+        # Routes are flagged once at startup; fall back to the pattern for
+        # unmatched paths and rules added afterwards
+        skip = getattr(request.url_rule, "skip_logging", None)
+        if skip is None:
+            skip = _SKIP_LOG_RE.match(request.path) is not None
+        return skip
 
 
 class PerformanceMiddleware:
@@ -268,33 +388,35 @@ class PerformanceMiddleware:
             app (Flask, optional): Flask application instance
         """
         self.app = app
-        self.metrics = {
-            "request_count": 0,
-            "total_duration": 0.0,
-            "error_count": 0,
-            "slow_requests": 0,
-        }
+        self._metrics_lock = threading.Lock()
+        self._counters = self._new_counters()
         if app is not None:
             self.init_app(app)
 
-    def init_app(self, app):
+    def init_app(self, app, register_hooks=True):
         """
         Initialize middleware with Flask application.
 
         Args:
             app (Flask): Flask application instance
+            register_hooks (bool): Register request hooks on the app; False when
+                driven by CombinedMiddleware
         """
         self.app = app
-        app.before_request(self.before_request)
-        app.after_request(self.after_request)
+        if register_hooks:
+            app.before_request(self.before_request)
+            app.after_request(self.after_request)
         logger.info("Performance middleware initialized")
 
     def before_request(self):
         """
         Record request start time for performance tracking.
+
+        LoggingMiddleware runs first and already sets ``g.start_time``; this
+        only applies when the performance middleware is used on its own.
         """
-        if not hasattr(g, "start_time"):
-            g.start_time = time.time()
+        if "start_time" not in g:
+            g.start_time = time.perf_counter()
 
     def after_request(self, response):
         """
@@ -307,19 +429,22 @@ class PerformanceMiddleware:
             Flask response object
         """
         # Calculate request duration
-        duration = time.time() - getattr(g, "start_time", time.time())
-
-        # Update metrics
-        self.metrics["request_count"] += 1
-        self.metrics["total_duration"] += duration
-
-        # Track errors
-        if response.status_code >= 400:
-            self.metrics["error_count"] += 1
-
-        # Track slow requests (> 1 second)
-        if duration > 1.0:
-            self.metrics["slow_requests"] += 1
+        now = time.perf_counter()
+        duration = now - g.get("start_time", now)
+
+        # Update metrics in one short critical section
+        is_error = response.status_code >= 400
+        is_slow = duration > 1.0  # Slow requests (> 1 second)
+        with self._metrics_lock:
+            counters = self._counters
+            counters["request_count"] += 1
+            counters["total_duration"] += duration
+            if is_error:
+                counters["error_count"] += 1
+            if is_slow:
+                counters["slow_requests"] += 1
+
+        if is_slow:
             logger.warning(
                 f"[WARNING] Slow request detected: {request.path} took {duration:.2f}s"
             )
@@ -335,6 +460,17 @@ class PerformanceMiddleware:
 
         return response
 
+    @property
+    def metrics(self):
+        """
+        Snapshot of the raw performance counters.
+
+        Returns:
+            dict: request_count, total_duration, error_count and slow_requests
+        """
+        with self._metrics_lock:
+            return dict(self._counters)
+
     def get_metrics(self):
         """
         Get current performance metrics.
@@ -342,26 +478,23 @@ class PerformanceMiddleware:
         Returns:
             dict: Performance metrics
         """
+        metrics = self.metrics
+        request_count = metrics["request_count"]
+
         avg_duration = (
-            self.metrics["total_duration"] / self.metrics["request_count"]
-            if self.metrics["request_count"] > 0
-            else 0
+            metrics["total_duration"] / request_count if request_count > 0 else 0
         )
 
         return {
-            "request_count": self.metrics["request_count"],
+            "request_count": request_count,
             "average_duration_ms": round(avg_duration * 1000, 2),
-            "error_count": self.metrics["error_count"],
+            "error_count": metrics["error_count"],
             "error_rate": (
-                self.metrics["error_count"] / self.metrics["request_count"]
-                if self.metrics["request_count"] > 0
-                else 0
+                metrics["error_count"] / request_count if request_count > 0 else 0
             ),
-            "slow_requests": self.metrics["slow_requests"],
+            "slow_requests": metrics["slow_requests"],
             "slow_request_rate": (
-                self.metrics["slow_requests"] / self.metrics["request_count"]
-                if self.metrics["request_count"] > 0
-                else 0
+                metrics["slow_requests"] / request_count if request_count > 0 else 0
             ),
         }
 
@@ -369,13 +502,24 @@ class PerformanceMiddleware:
         """
         Reset performance metrics.
         """
-        self.metrics = {
+        with self._metrics_lock:
+            self._counters = self._new_counters()
+        logger.info("[INFO] Performance metrics reset")
+
+    @staticmethod
+    def _new_counters():
+        """
+        Create zeroed performance counters.
+
+        Returns:
+            dict: request_count, total_duration, error_count and slow_requests
+        """
+        return {
             "request_count": 0,
             "total_duration": 0.0,
             "error_count": 0,
             "slow_requests": 0,
         }
-        logger.info("[INFO] Performance metrics reset")
 
 
 # Create middleware instances
@@ -6,20 +6,50 @@ for all database models in the application. It includes common fields, methods
 for serialization/deserialization, and validation functionality.
 """
 
+import keyword
 import logging
+import re
 from abc import ABCMeta
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Column, DateTime, Integer, inspect
+from sqlalchemy import Column, DateTime, Integer, event, func, inspect, literal, select
 from sqlalchemy.ext.declarative import declared_attr
-from sqlalchemy.orm import validates
+from sqlalchemy.orm import load_only, validates
 
 from app.extensions import db
 
 logger = logging.getLogger(__name__)
 
+# CamelCase -> snake_case conversion for generated table names
+_CAMEL_WORD_RE = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
+
+# Basic email format check used by ValidationMixin
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z", re.ASCII)
+
+# Fields ignored by from_dict/update_from_dict unless the caller overrides them
+_FROM_DICT_EXCLUDE = frozenset(("id", "created_at", "updated_at"))
+_UPDATE_FROM_DICT_EXCLUDE = frozenset(("id", "created_at"))
+
+
+@lru_cache(maxsize=None)
+def _table_name_for(class_name: str) -> str:
+    """
+    Derive a pluralized snake_case table name from a model class name.
+
+    Args:
+        class_name (str): Model class name in CamelCase
+
+    Returns:
+        str: Table name
+    """
+    name = _CAMEL_WORD_RE.sub(r"\1_\2", class_name)
+    name = _CAMEL_BOUNDARY_RE.sub(r"\1_\2", name).lower()
+    return name + "s" if not name.endswith("s") else name
+
 
 class BaseModelMeta(db.Model.__class__, ABCMeta):
     """
@@ -51,17 +81,17 @@ class BaseModel(db.Model, metaclass=BaseModelMeta):
         DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
     )
 
+    # Generated once the class's mapper is configured; until then from_dict
+    # goes through __init__, which configures it
+    _from_dict_fast = None
+
     @declared_attr
     def __tablename__(cls):
         """
         Generate table name from class name.
         Converts CamelCase to snake_case and adds 's' for plural.
         """
-        import re
-
-        name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", cls.__name__)
-        name = re.sub("([a-z0-9])([A-Z])", r"\1_\2", name).lower()
-        return name + "s" if not name.endswith("s") else name
+        return _table_name_for(cls.__name__)
 
     def __init__(self, **kwargs):
         """
@@ -71,14 +101,70 @@ class BaseModel(db.Model, metaclass=BaseModelMeta):
             **kwargs: Field values to set on the model
         """
         super().__init__()
+        allowed = self._allowed_attrs()
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in allowed:
                 setattr(self, key, value)
-            else:
-                logger.warning(
-                    f"Attempted to set unknown attribute '{key}' on {self.__class__.__name__}"
+            elif logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Ignoring unknown attribute '%s' on %s",
+                    key,
+                    self.__class__.__name__,
                 )
 
+    @classmethod
+    def _allowed_attrs(cls) -> frozenset:
+        """
+        Get the names of mapped attributes that may be set from keyword args.
+
+        Covers columns, relationships, synonyms and hybrid properties, but not
+        database-generated columns. Cached on the class itself, so each subclass
+        gets its own entry.
+
+        Returns:
+            frozenset: Attribute names
+        """
+        allowed = cls.__dict__.get("_allowed_attrs_cache")
+        if allowed is None:
+            mapper = inspect(cls)
+            computed = _computed_column_keys(mapper)
+            allowed = frozenset(
+                key
+                for key in mapper.all_orm_descriptors.keys()
+                if not key.startswith("__") and key not in computed
+            )
+            cls._allowed_attrs_cache = allowed
+        return allowed
+
+    @classmethod
+    def _serialization_spec(cls):
+        """
+        Get column and relationship metadata for this model class.
+
+        Built from the mapper on first use and cached on the class itself, so
+        each subclass gets its own entry.
+
+        Relationships are described as ``(key, uselist, target_has_to_dict)``
+        tuples, taken from the mapper rather than probed on each related value.
+
+        Returns:
+            tuple: (DateTime column names, other column names, relationships)
+        """
+        spec = cls.__dict__.get("_spec_cache")
+        if spec is None:
+            mapper = inspect(cls)
+            columns = tuple(mapper.columns)
+            spec = (
+                tuple(c.name for c in columns if isinstance(c.type, DateTime)),
+                tuple(c.name for c in columns if not isinstance(c.type, DateTime)),
+                tuple(
+                    (rel.key, rel.uselist, hasattr(rel.mapper.class_, "to_dict"))
+                    for rel in mapper.relationships
+                ),
+            )
+            cls._spec_cache = spec
+        return spec
+
     def __repr__(self):
         """
         String representation of the model instance.
@@ -91,54 +177,59 @@ class BaseModel(db.Model, metaclass=BaseModelMeta):
     def to_dict(
         self,
         include_relationships: bool = False,
-        exclude_fields: Optional[List[str]] = None,
+        exclude_fields: Optional[Iterable[str]] = None,
     ) -> Dict[str, Any]:
         """
         Convert model instance to dictionary representation.
 
         Args:
             include_relationships (bool): Whether to include relationship data
-            exclude_fields (List[str], optional): Fields to exclude from serialization
+            exclude_fields (Iterable[str], optional): Fields to exclude from
+                serialization; a frozenset is used as-is
 
         Returns:
             Dict[str, Any]: Dictionary representation of the model
         """
-        exclude_fields = exclude_fields or []
+        exclude_fields = frozenset(exclude_fields) if exclude_fields else frozenset()
+
+        # Column-only serialization uses the generated per-class function
+        if not include_relationships:
+            return self._to_dict_fast(exclude_fields)
+
         result = {}
+        datetime_columns, plain_columns, relationships = self._serialization_spec()
 
-        # Get all columns
-        mapper = inspect(self.__class__)
-        for column in mapper.columns:
-            if column.name not in exclude_fields:
-                value = getattr(self, column.name)
-                if isinstance(value, datetime):
-                    result[column.name] = value.isoformat()
-                else:
-                    result[column.name] = value
+        # Get all columns; only DateTime columns need conversion
+        for name in plain_columns:
+            if name not in exclude_fields:
+                result[name] = getattr(self, name)
+        for name in datetime_columns:
+            if name not in exclude_fields:
+                value = getattr(self, name)
+                result[name] = value.isoformat() if value is not None else None
 
         # Include relationships if requested
-        if include_relationships:
-            for relationship in mapper.relationships:
-                if relationship.key not in exclude_fields:
-                    related_obj = getattr(self, relationship.key)
-                    if related_obj is not None:
-                        if hasattr(related_obj, "__iter__") and not isinstance(
-                            related_obj, str
-                        ):
-                            # One-to-many or many-to-many relationship
-                            result[relationship.key] = [
-                                obj.to_dict(include_relationships=False)
-                                if hasattr(obj, "to_dict")
-                                else str(obj)
-                                for obj in related_obj
-                            ]
-                        else:
-                            # One-to-one or many-to-one relationship
-                            result[relationship.key] = (
-                                related_obj.to_dict(include_relationships=False)
-                                if hasattr(related_obj, "to_dict")
-                                else str(related_obj)
-                            )
+        for key, uselist, has_to_dict in relationships:
+            if key in exclude_fields:
+                continue
+            related_obj = getattr(self, key)
+            if related_obj is None:
+                continue
+            if uselist:
+                # One-to-many or many-to-many relationship
+                if has_to_dict:
+                    result[key] = [
+                        obj.to_dict(include_relationships=False) for obj in related_obj
+                    ]
+                else:
+                    result[key] = [str(obj) for obj in related_obj]
+            else:
+                # One-to-one or many-to-one relationship
+                result[key] = (
+                    related_obj.to_dict(include_relationships=False)
+                    if has_to_dict
+                    else str(related_obj)
+                )
 
         return result
 
@@ -159,11 +250,14 @@ class BaseModel(db.Model, metaclass=BaseModelMeta):
         Raises:
             ValueError: If required fields are missing or invalid data is provided
         """
-        exclude_fields = exclude_fields or ["id", "created_at", "updated_at"]
-        filtered_data = {k: v for k, v in data.items() if k not in exclude_fields}
+        exclude = frozenset(exclude_fields or _FROM_DICT_EXCLUDE)
 
         try:
-            instance = cls(**filtered_data)
+            if cls._from_dict_fast is not None:
+                instance = cls._from_dict_fast(cls, data, exclude)
+            else:
+                filtered_data = {k: v for k, v in data.items() if k not in exclude}
+                instance = cls(**filtered_data)
             instance.validate()
             return instance
         except Exception as e:
@@ -183,10 +277,11 @@ class BaseModel(db.Model, metaclass=BaseModelMeta):
         Raises:
             ValueError: If invalid data is provided
         """
-        exclude_fields = exclude_fields or ["id", "created_at"]
+        exclude = frozenset(exclude_fields or _UPDATE_FROM_DICT_EXCLUDE)
+        allowed = self._allowed_attrs()
 
         for key, value in data.items():
-            if key not in exclude_fields and hasattr(self, key):
+            if key in allowed and key not in exclude:
                 setattr(self, key, value)
 
         # Update the updated_at timestamp
@@ -211,17 +306,7 @@ class BaseModel(db.Model, metaclass=BaseModelMeta):
         """
         # Basic validation - check for None values in non-nullable columns
         # Skip columns that have default values or are auto-generated
-        mapper = inspect(self.__class__)
-        for column in mapper.columns:
-            if not column.nullable and column.name not in ["id"]:
-                value = getattr(self, column.name)
-                # Skip validation if column has a default value and current value is None
-                if (
-                    value is None
-                    and column.default is None
-                    and column.server_default is None
-                ):
-                    raise ValueError(f"Field '{column.name}' cannot be None")
+        self._check_required()
 
         # Call custom validation method if implemented
         if hasattr(self, "_validate_custom"):
@@ -242,11 +327,51 @@ class BaseModel(db.Model, metaclass=BaseModelMeta):
             self.validate()
             db.session.add(self)
             db.session.commit()
-            logger.info(f"Saved {self.__class__.__name__} with id {self.id}")
+            # Reading id after commit reloads the expired instance, so only do
+            # it when the message will actually be emitted
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Saved %s with id %s", self.__class__.__name__, self.id)
             return self
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Failed to save {self.__class__.__name__}: {e}")
+            logger.error("Failed to save %s: %s", self.__class__.__name__, e)
+            raise
+
+    @classmethod
+    def bulk_save(cls, items: List[Any]) -> int:
+        """
+        Insert many records in a single transaction.
+
+        Model instances are validated and written with ``bulk_save_objects``.
+        Plain dicts of column values skip instance construction and validation
+        and are inserted with one executemany INSERT.
+
+        Args:
+            items (List[Any]): Model instances and/or dicts of column values
+
+        Returns:
+            int: Number of records written
+
+        Raises:
+            ValueError: If validation fails
+            Exception: If database operation fails
+        """
+        instances = [item for item in items if isinstance(item, BaseModel)]
+        rows = [item for item in items if not isinstance(item, BaseModel)]
+
+        try:
+            for instance in instances:
+                instance.validate()
+            if instances:
+                db.session.bulk_save_objects(instances)
+            if rows:
+                db.session.execute(cls.__table__.insert(), rows)
+            db.session.commit()
+            logger.info("Bulk saved %d %s records", len(items), cls.__name__)
+            return len(items)
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Failed to bulk save %s records: %s", cls.__name__, e)
             raise
 
     def delete(self) -> bool:
@@ -262,54 +387,115 @@ class BaseModel(db.Model, metaclass=BaseModelMeta):
         try:
             db.session.delete(self)
             db.session.commit()
-            logger.info(f"Deleted {self.__class__.__name__} with id {self.id}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Deleted %s with id %s", self.__class__.__name__, self.id)
             return True
         except Exception as e:
             db.session.rollback()
             logger.error(
-                f"Failed to delete {self.__class__.__name__} with id {self.id}: {e}"
+                "Failed to delete %s with id %s: %s",
+                self.__class__.__name__,
+                self.id,
+                e,
             )
             raise
 
     @classmethod
-    def get_by_id(cls, id: int):
+    def _load_only(cls, columns: Optional[List[str]]):
+        """
+        Build a loader option restricting loaded columns.
+
+        Args:
+            columns (List[str], optional): Column attribute names to load
+
+        Returns:
+            list: Loader options for the query, empty when ``columns`` is None
+        """
+        if not columns:
+            return []
+        return [load_only(*(getattr(cls, name) for name in columns))]
+
+    @classmethod
+    def get_by_id(cls, id: int, columns: Optional[List[str]] = None):
         """
         Get model instance by ID.
 
         Args:
             id (int): The ID to search for
+            columns (List[str], optional): Only load these columns; others are
+                deferred until accessed
 
         Returns:
             BaseModel or None: The model instance if found, None otherwise
+
+        Raises:
+            SQLAlchemyError: If the database query fails
         """
-        try:
-            return cls.query.get(id)
-        except Exception as e:
-            logger.error(f"Failed to get {cls.__name__} by id {id}: {e}")
-            return None
+        return db.session.get(cls, id, options=cls._load_only(columns))
 
     @classmethod
-    def get_all(cls, limit: Optional[int] = None, offset: Optional[int] = None):
+    def get_all(
+        cls,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ):
         """
         Get all model instances with optional pagination.
 
         Args:
             limit (int, optional): Maximum number of records to return
             offset (int, optional): Number of records to skip
+            columns (List[str], optional): Only load these columns; others are
+                deferred until accessed
 
         Returns:
             List[BaseModel]: List of model instances
+
+        Raises:
+            SQLAlchemyError: If the database query fails
         """
-        try:
-            query = cls.query
-            if offset:
-                query = query.offset(offset)
-            if limit:
-                query = query.limit(limit)
-            return query.all()
-        except Exception as e:
-            logger.error(f"Failed to get all {cls.__name__} records: {e}")
-            return []
+        query = cls.query
+        if columns:
+            query = query.options(*cls._load_only(columns))
+        if offset:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+
+    @classmethod
+    def iter_all(
+        cls,
+        batch_size: int = 500,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Iterator["BaseModel"]:
+        """
+        Iterate over model instances, fetching rows in batches.
+
+        Unlike get_all(), rows are streamed with ``yield_per`` so only about
+        ``batch_size`` instances are held in memory at a time.
+
+        Args:
+            batch_size (int): Number of rows fetched per round trip
+            limit (int, optional): Maximum number of records to return
+            offset (int, optional): Number of records to skip
+            columns (List[str], optional): Only load these columns; others are
+                deferred until accessed
+
+        Yields:
+            BaseModel: Model instances ordered by id
+        """
+        query = cls.query.order_by(cls.id)
+        if columns:
+            query = query.options(*cls._load_only(columns))
+        if offset:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+        yield from query.yield_per(batch_size)
 
     @classmethod
     def count(cls) -> int:
@@ -318,12 +504,11 @@ class BaseModel(db.Model, metaclass=BaseModelMeta):
 
         Returns:
             int: Total number of records
+
+        Raises:
+            SQLAlchemyError: If the database query fails
         """
-        try:
-            return cls.query.count()
-        except Exception as e:
-            logger.error(f"Failed to count {cls.__name__} records: {e}")
-            return 0
+        return db.session.execute(select(func.count()).select_from(cls)).scalar()
 
     @classmethod
     def exists(cls, **filters) -> bool:
@@ -337,16 +522,184 @@ class BaseModel(db.Model, metaclass=BaseModelMeta):
             bool: True if record exists, False otherwise
         """
         try:
-            query = cls.query
-            for field, value in filters.items():
-                if hasattr(cls, field):
-                    query = query.filter(getattr(cls, field) == value)
-            return query.first() is not None
+            conditions = [
+                getattr(cls, field) == value
+                for field, value in filters.items()
+                if hasattr(cls, field)
+            ]
+            subquery = select(literal(1)).select_from(cls).where(*conditions)
+            return db.session.execute(select(subquery.exists())).scalar()
         except Exception as e:
             logger.error(f"Failed to check existence of {cls.__name__}: {e}")
             return False
 
 
+def _computed_column_keys(mapper) -> frozenset:
+    """
+    Get the attribute names of columns whose values the database generates.
+
+    Args:
+        mapper: Mapper of the model
+
+    Returns:
+        frozenset: Attribute names of ``Computed`` columns
+    """
+    return frozenset(
+        key for key, column in mapper.columns.items() if column.computed is not None
+    )
+
+
+def _attribute_read(name: str) -> str:
+    """
+    Build a source expression reading attribute ``name`` from ``self``.
+
+    Args:
+        name (str): Attribute name
+
+    Returns:
+        str: Python expression
+    """
+    if name.isidentifier() and not keyword.iskeyword(name):
+        return f"self.{name}"
+    return f"getattr(self, {name!r})"
+
+
+def _compile_function(lines: List[str], func_name: str, cls) -> Any:
+    """
+    Compile generated source and return the function it defines.
+
+    Args:
+        lines (List[str]): Source lines defining ``func_name``
+        func_name (str): Name of the generated function
+        cls: Model class, used to label the code object
+
+    Returns:
+        Callable: The compiled function
+    """
+    namespace = {}
+    code = compile("\n".join(lines), f"<{cls.__name__}.{func_name}>", "exec")
+    exec(code, namespace)
+    return namespace[func_name]
+
+
+def _build_to_dict(mapper, cls):
+    """
+    Generate a column serializer specialized for one model class.
+
+    Every column is inlined by name and DateTime columns are converted with
+    ``isoformat()`` directly, so no per-value type checks or introspection
+    happen at call time.
+
+    Args:
+        mapper: Mapper of the model
+        cls: Model class
+
+    Returns:
+        Callable[[BaseModel, frozenset], Dict[str, Any]]: Serializer function
+    """
+    lines = ["def _to_dict_fast(self, exclude):", "    r = {}"]
+    for column in mapper.columns:
+        key = repr(column.name)
+        read = _attribute_read(column.name)
+        lines.append(f"    if {key} not in exclude:")
+        if isinstance(column.type, DateTime):
+            lines.append(f"        v = {read}")
+            lines.append(f"        r[{key}] = v.isoformat() if v is not None else None")
+        else:
+            lines.append(f"        r[{key}] = {read}")
+    lines.append("    return r")
+
+    return _compile_function(lines, "_to_dict_fast", cls)
+
+
+def _build_check_required(required_columns, cls):
+    """
+    Generate the required-column check used by validate().
+
+    Args:
+        required_columns (tuple): Names of columns that must not be None
+        cls: Model class
+
+    Returns:
+        Callable[[BaseModel], None]: Check raising ValueError on a missing field
+    """
+    # Persistent rows already satisfied NOT NULL when written, so attributes
+    # that are expired or deferred are skipped rather than loaded
+    lines = [
+        "def _check_required(self):",
+        "    loaded = self.__dict__",
+        "    persistent = self._sa_instance_state.key is not None",
+    ]
+    for name in required_columns:
+        message = repr(f"Field '{name}' cannot be None")
+        lines.append(
+            f"    if loaded.get({name!r}) is None"
+            f" and ({name!r} in loaded or not persistent):"
+        )
+        lines.append(f"        raise ValueError({message})")
+    lines.append("    return None")
+
+    return _compile_function(lines, "_check_required", cls)
+
+
+def _build_from_dict(mapper, cls):
+    """
+    Generate a constructor from dict data specialized for one model class.
+
+    Each mapped attribute is assigned by name straight from ``data``, which
+    skips the intermediate filtered dict and the generic ``__init__`` loop.
+    Only used for classes that keep BaseModel's ``__init__``; a custom
+    constructor may consume keys that are not mapped attributes.
+
+    Args:
+        mapper: Mapper of the model
+        cls: Model class
+
+    Returns:
+        Callable or None: Constructor function, None if ``__init__`` is overridden
+    """
+    if mapper.class_manager.original_init is not BaseModel.__init__:
+        return None
+
+    computed = _computed_column_keys(mapper)
+    lines = ["def _from_dict_fast(cls, data, exclude):", "    self = cls()"]
+    for name in mapper.all_orm_descriptors.keys():
+        if name.startswith("__") or name in computed:
+            continue
+        key = repr(name)
+        lines.append(f"    if {key} in data and {key} not in exclude:")
+        if name.isidentifier() and not keyword.iskeyword(name):
+            lines.append(f"        self.{name} = data[{key}]")
+        else:
+            lines.append(f"        setattr(self, {key}, data[{key}])")
+    lines.append("    return self")
+
+    return _compile_function(lines, "_from_dict_fast", cls)
+
+
+@event.listens_for(BaseModel, "mapper_configured", propagate=True)
+def _on_mapper_configured(mapper, cls):
+    """
+    Precompute per-class validation and serialization helpers.
+
+    Args:
+        mapper: Mapper of the configured model
+        cls: Model class
+    """
+    # Columns validate() must check
+    cls._required_columns = tuple(
+        column.name
+        for column in mapper.columns
+        if not column.nullable
+        and column.name != "id"
+        and column.default is None
+        and column.server_default is None
+    )
+    cls._check_required = _build_check_required(cls._required_columns, cls)
+    cls._to_dict_fast = _build_to_dict(mapper, cls)
+    cls._from_dict_fast = _build_from_dict(mapper, cls)
+
+
 class ValidationMixin:
     """
     Mixin class providing additional validation utilities.
@@ -367,7 +720,8 @@ class ValidationMixin:
         """
         for field in required_fields:
             value = getattr(self, field, None)
-            if value is None or (isinstance(value, str) and not value.strip()):
+            # isspace() avoids the copy strip() makes of long values
+            if value is None or (type(value) is str and (not value or value.isspace())):
                 raise ValueError(f"Field '{field}' is required and cannot be empty")
 
     def validate_field_length(
@@ -388,7 +742,7 @@ class ValidationMixin:
             ValueError: If field length is outside allowed range
         """
         value = getattr(self, field_name, None)
-        if value is not None and isinstance(value, str):
+        if type(value) is str:
             if min_length is not None and len(value) < min_length:
                 raise ValueError(
                     f"Field '{field_name}' must be at least {min_length} characters long"
@@ -408,13 +762,9 @@ class ValidationMixin:
         Raises:
             ValueError: If email format is invalid
         """
-        import re
-
         value = getattr(self, field_name, None)
-        if value is not None:
-            email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-            if not re.match(email_pattern, value):
-                raise ValueError(f"Field '{field_name}' must be a valid email address")
+        if value is not None and not _EMAIL_RE.match(value):
+            raise ValueError(f"Field '{field_name}' must be a valid email address")
 
     def validate_unique_field(
         self, field_name: str, exclude_id: Optional[int] = None
@@ -431,13 +781,21 @@ class ValidationMixin:
         """
         value = getattr(self, field_name, None)
         if value is not None:
-            query = self.__class__.query.filter(
-                getattr(self.__class__, field_name) == value
+            cls = self.__class__
+            # SELECT EXISTS(...) returns a single boolean; no row or ORM
+            # instance is loaded
+            subquery = (
+                select(literal(1))
+                .select_from(cls)
+                .where(getattr(cls, field_name) == value)
             )
             if exclude_id:
-                query = query.filter(self.__class__.id != exclude_id)
+                subquery = subquery.where(cls.id != exclude_id)
 
-            if query.first() is not None:
+            # Don't flush this instance's own pending change before checking
+            with db.session.no_autoflush:
+                duplicate = db.session.execute(select(subquery.exists())).scalar()
+            if duplicate:
                 raise ValueError(
                     f"Field '{field_name}' must be unique. Value '{value}' already exists"
                 )
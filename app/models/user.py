@@ -5,18 +5,320 @@ This module provides the User model class that handles user data,
 authentication, and user state management functionality.
 """
 
+import hashlib
+import hmac
 import logging
-from datetime import datetime
-from typing import Any, Dict, Optional
-
-from sqlalchemy import Boolean, Column, DateTime, String, Text
-from sqlalchemy.orm import validates
-from werkzeug.security import check_password_hash, generate_password_hash
+import re
+import secrets
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from cachetools import TTLCache
+from flask import g, has_request_context
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    Computed,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    false,
+    func,
+    inspect,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.orm import deferred, undefer, validates
+from sqlalchemy.orm.attributes import set_committed_value
+from werkzeug.security import check_password_hash
+
+from app.extensions import db
 
 from .base import BaseModel, ValidationMixin
 
 logger = logging.getLogger(__name__)
 
+# Letters, digits and underscores only (\Z rejects a trailing newline)
+_USERNAME_RE = re.compile(r"^[a-zA-Z0-9_]+\Z")
+
+# Columns matched by search_users
+_SEARCH_COLUMNS = ("username", "email", "first_name", "last_name")
+
+# Separates the columns in search_blob; a term containing it would match
+# across two columns, so such terms are rejected
+_SEARCH_BLOB_SEPARATOR = "\x1f"
+
+# Generated search_blob column: the lowercased search columns joined by the
+# separator
+_SEARCH_BLOB_SQL = "LOWER({})".format(
+    f" || '{_SEARCH_BLOB_SEPARATOR}' || ".join(
+        f"COALESCE({name}, '')" for name in _SEARCH_COLUMNS
+    )
+)
+
+# Fields never included in to_dict() output
+_SENSITIVE_FIELDS = frozenset(
+    (
+        "password_hash",
+        "email_verification_token",
+        "password_reset_token",
+        "failed_login_attempts",
+        "search_blob",
+    )
+)
+
+# Generated full_name column; mirrors _full_name(), NULL when no name is set
+_FULL_NAME_SQL = (
+    "CASE WHEN first_name <> '' AND last_name <> ''"
+    " THEN first_name || ' ' || last_name"
+    " ELSE COALESCE(NULLIF(first_name, ''), NULLIF(last_name, '')) END"
+)
+
+# scrypt cost parameters for newly hashed passwords (N=2**15 uses 32 MiB)
+PASSWORD_SCRYPT_N = 32768
+PASSWORD_SCRYPT_R = 8
+PASSWORD_SCRYPT_P = 1
+_PASSWORD_HASH_METHOD = (
+    f"scrypt:{PASSWORD_SCRYPT_N}:{PASSWORD_SCRYPT_R}:{PASSWORD_SCRYPT_P}"
+)
+
+# last_login_at is only rewritten once this much time has passed
+LAST_LOGIN_UPDATE_INTERVAL = timedelta(minutes=5)
+
+# Recently verified passwords, keyed by (user id, stored hash) and holding a
+# keyed SHA-256 of the password. Repeat logins within the TTL skip the
+# password KDF (scrypt, or PBKDF2 for legacy hashes); changing the password
+# changes the stored hash and so misses the cache.
+_verified_password_cache = TTLCache(maxsize=10000, ttl=60)
+_verified_password_cache_lock = threading.Lock()
+_verified_password_pepper = secrets.token_bytes(32)
+
+
+def _now() -> datetime:
+    """
+    Get the current UTC time, read once per request.
+
+    Inside a request the first value is stored on ``g`` so every timestamp a
+    request writes on a user is identical and the clock is read only once.
+
+    Returns:
+        datetime: Naive UTC datetime, matching the model's DateTime columns
+    """
+    if not has_request_context():
+        return datetime.utcnow()
+    now = g.get("request_utcnow")
+    if now is None:
+        now = g.request_utcnow = datetime.utcnow()
+    return now
+
+
+def _scrypt_hex(password: str, salt: str, n: int, r: int, p: int) -> str:
+    """
+    Derive a hex encoded scrypt key the same way Werkzeug does.
+
+    Args:
+        password (str): Plain text password
+        salt (str): Salt stored alongside the hash
+        n (int): CPU/memory cost
+        r (int): Block size
+        p (int): Parallelism
+
+    Returns:
+        str: Hex encoded 64 byte key
+    """
+    return hashlib.scrypt(
+        password.encode(), salt=salt.encode(), n=n, r=r, p=p, maxmem=132 * n * r * p
+    ).hex()
+
+
+def _hash_password(password: str) -> str:
+    """
+    Hash a password with scrypt using hashlib's native implementation.
+
+    The result uses Werkzeug's ``scrypt:<n>:<r>:<p>$<salt>$<hash>`` format, so
+    it can also be verified with ``check_password_hash``.
+
+    Args:
+        password (str): Plain text password
+
+    Returns:
+        str: Encoded password hash
+    """
+    salt = secrets.token_hex(8)
+    digest = _scrypt_hex(
+        password, salt, PASSWORD_SCRYPT_N, PASSWORD_SCRYPT_R, PASSWORD_SCRYPT_P
+    )
+    return f"{_PASSWORD_HASH_METHOD}${salt}${digest}"
+
+
+def _verify_password(password_hash: str, password: str) -> bool:
+    """
+    Verify a password against a stored hash.
+
+    scrypt and PBKDF2 hashes are checked directly with ``hashlib``; any other
+    Werkzeug format is delegated to ``check_password_hash``.
+
+    Args:
+        password_hash (str): Stored password hash
+        password (str): Plain text password to verify
+
+    Returns:
+        bool: True if the password matches
+    """
+    if not password_hash.startswith(("scrypt:", "pbkdf2:")):
+        return check_password_hash(password_hash, password)
+
+    try:
+        method, salt, expected = password_hash.split("$", 2)
+        name, *params = method.split(":")
+        if name == "scrypt":
+            n, r, p = (int(param) for param in params)
+            digest = _scrypt_hex(password, salt, n, r, p)
+        else:
+            hash_name, iterations = params
+            digest = hashlib.pbkdf2_hmac(
+                hash_name, password.encode(), salt.encode(), int(iterations)
+            ).hex()
+    except ValueError:
+        return False
+
+    return hmac.compare_digest(digest, expected)
+
+
+def _password_needs_rehash(password_hash: str) -> bool:
+    """
+    Check whether a stored hash predates the current hashing parameters.
+
+    Args:
+        password_hash (str): Stored password hash
+
+    Returns:
+        bool: True if the hash should be replaced
+    """
+    return not password_hash.startswith(f"{_PASSWORD_HASH_METHOD}$")
+
+
+def _full_name(first_name: Optional[str], last_name: Optional[str]) -> Optional[str]:
+    """
+    Join first and last name, skipping missing parts.
+
+    Args:
+        first_name (str, optional): First name
+        last_name (str, optional): Last name
+
+    Returns:
+        str or None: Full name, None if neither part is set
+    """
+    if first_name and last_name:
+        return f"{first_name} {last_name}"
+    return first_name or last_name or None
+
+
+def _display_name(full_name: str, username: str) -> str:
+    """
+    Derive the display name from an already computed full name.
+
+    Args:
+        full_name (str): Result of User.get_full_name()
+        username (str): Username
+
+    Returns:
+        str: Full name, or ``@username`` when no name is set
+    """
+    return full_name if full_name != username else f"@{username}"
+
+
+def _hash_token(token: str) -> str:
+    """
+    Digest a one-time token for storage and lookup.
+
+    Args:
+        token (str): Raw token as sent to the user
+
+    Returns:
+        str: Hex SHA-256 digest of the token
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _password_fingerprint(password: str) -> bytes:
+    """
+    Compute the cache fingerprint of a password.
+
+    Args:
+        password (str): Plain text password
+
+    Returns:
+        bytes: HMAC-SHA256 of the password under a per-process pepper
+    """
+    return hmac.new(
+        _verified_password_pepper, password.encode(), hashlib.sha256
+    ).digest()
+
+
+# Columns a User is memoized under for the rest of the request
+_MEMO_FIELDS = ("username", "email", "password_reset_token", "email_verification_token")
+
+
+def _get_memoized_user(field: str, value: Any) -> Optional["User"]:
+    """
+    Get a user already looked up by this column value during the request.
+
+    Entries whose user was deleted, rolled back or changed the column since
+    they were stored are discarded.
+
+    Args:
+        field (str): Column name
+        value: Column value (tokens are the stored hashes)
+
+    Returns:
+        User or None: Memoized user, None on a miss or outside a request
+    """
+    if not has_request_context():
+        return None
+    memo = g.get("user_lookup_memo")
+    if not memo:
+        return None
+    user = memo.get((field, value))
+    if user is None:
+        return None
+    if not inspect(user).persistent or getattr(user, field) != value:
+        del memo[(field, value)]
+        return None
+    return user
+
+
+def _memoize_user(user: Optional["User"]) -> Optional["User"]:
+    """
+    Remember a looked up user for the rest of the request.
+
+    The memo on ``g`` also holds a strong reference, so the instance stays in
+    the session's weakly referencing identity map until the request ends.
+
+    Args:
+        user (User, optional): Lookup result; None is not memoized
+
+    Returns:
+        User or None: The given user
+    """
+    if user is None or not has_request_context():
+        return user
+    memo = g.get("user_lookup_memo")
+    if memo is None:
+        memo = g.user_lookup_memo = {}
+    for field in _MEMO_FIELDS:
+        value = getattr(user, field)
+        if value is not None:
+            memo[(field, value)] = user
+    return user
+
 
 class User(BaseModel, ValidationMixin):
     """
@@ -32,11 +334,15 @@ class User(BaseModel, ValidationMixin):
     # User identification fields
     username = Column(String(80), unique=True, nullable=False, index=True)
     email = Column(String(120), unique=True, nullable=False, index=True)
-    password_hash = Column(String(255), nullable=False)
+    # Only the login path needs the hash; other reads leave it unloaded
+    password_hash = deferred(Column(String(255), nullable=False))
 
     # User profile fields
     first_name = Column(String(50), nullable=True)
     last_name = Column(String(50), nullable=True)
+    full_name = Column(String(101), Computed(_FULL_NAME_SQL, persisted=True))
+    # Only read by the database when searching
+    search_blob = deferred(Column(Text, Computed(_SEARCH_BLOB_SQL, persisted=True)))
     bio = Column(Text, nullable=True)
 
     # User state management fields
@@ -47,17 +353,51 @@ class User(BaseModel, ValidationMixin):
     # Authentication tracking fields
     last_login_at = Column(DateTime, nullable=True)
     password_changed_at = Column(DateTime, nullable=True)
-    failed_login_attempts = Column(String(10), default="0", nullable=False)
+    failed_login_attempts = Column(Integer, default=0, nullable=False)
     locked_until = Column(DateTime, nullable=True)
 
     # Email verification fields
     email_verified_at = Column(DateTime, nullable=True)
-    email_verification_token = Column(String(255), nullable=True)
+    email_verification_token = Column(String(255), nullable=True, index=True)
 
     # Password reset fields
-    password_reset_token = Column(String(255), nullable=True)
+    password_reset_token = Column(String(255), nullable=True, index=True)
     password_reset_expires_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        # Partial indexes for the active/verified user listings
+        Index(
+            "ix_users_active",
+            "is_active",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+        Index(
+            "ix_users_verified",
+            "is_verified",
+            postgresql_where=text("is_verified"),
+            sqlite_where=text("is_verified = 1"),
+        ),
+        # Pattern-ops btree indexes serve prefix LIKE searches on PostgreSQL
+        # regardless of the database collation
+        *(
+            Index(
+                f"ix_users_{name}_prefix",
+                name,
+                postgresql_ops={name: "varchar_pattern_ops"},
+            ).ddl_if(dialect="postgresql")
+            for name in ("username", "email")
+        ),
+        # A trigram index lets search_users' leading-wildcard LIKE pattern
+        # use an index on PostgreSQL (requires the pg_trgm extension)
+        Index(
+            "ix_users_search_blob_trgm",
+            "search_blob",
+            postgresql_using="gin",
+            postgresql_ops={"search_blob": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     def __init__(self, **kwargs):
         """
         Initialize User instance.
@@ -76,7 +416,7 @@ class User(BaseModel, ValidationMixin):
         if "is_admin" not in kwargs:
             kwargs["is_admin"] = False
         if "failed_login_attempts" not in kwargs:
-            kwargs["failed_login_attempts"] = "0"
+            kwargs["failed_login_attempts"] = 0
 
         super().__init__(**kwargs)
 
@@ -105,9 +445,29 @@ class User(BaseModel, ValidationMixin):
         if not password or len(password.strip()) < 8:
             raise ValueError("Password must be at least 8 characters long")
 
-        self.password_hash = generate_password_hash(password)
-        self.password_changed_at = datetime.utcnow()
-        logger.info(f"Password updated for user {self.username}")
+        self.password_hash = _hash_password(password)
+        self.password_changed_at = _now()
+        logger.info("Password updated for user %s", self.username)
+
+    def rehash_password_if_needed(self, password: str) -> bool:
+        """
+        Upgrade a legacy password hash to the current parameters.
+
+        Must only be called with a password that was just verified. Unlike
+        set_password this leaves password_changed_at untouched.
+
+        Args:
+            password (str): Verified plain text password
+
+        Returns:
+            bool: True if the stored hash was replaced
+        """
+        if not self.password_hash or not _password_needs_rehash(self.password_hash):
+            return False
+
+        self.password_hash = _hash_password(password)
+        logger.info("Password hash upgraded for user %s", self.username)
+        return True
 
     def check_password(self, password: str) -> bool:
         """
@@ -122,34 +482,91 @@ class User(BaseModel, ValidationMixin):
         if not password or not self.password_hash:
             return False
 
-        is_valid = check_password_hash(self.password_hash, password)
+        cache_key = (self.id, self.password_hash)
+        fingerprint = _password_fingerprint(password)
+        with _verified_password_cache_lock:
+            cached = _verified_password_cache.get(cache_key)
+
+        if cached is not None and hmac.compare_digest(cached, fingerprint):
+            is_valid = True
+        else:
+            is_valid = _verify_password(self.password_hash, password)
+            if is_valid and self.id is not None:
+                with _verified_password_cache_lock:
+                    _verified_password_cache[cache_key] = fingerprint
 
         if is_valid:
-            # Reset failed login attempts on successful login
-            self.failed_login_attempts = "0"
-            self.last_login_at = datetime.utcnow()
-            self.locked_until = None
-            logger.info(f"Successful login for user {self.username}")
+            # Reset failed login attempts on successful login. Only touch
+            # attributes that actually change, so a routine login by a user in
+            # good standing leaves the row clean and no UPDATE is issued
+            if self.failed_login_attempts != 0:
+                self.failed_login_attempts = 0
+            if self.locked_until is not None:
+                self.locked_until = None
+            now = _now()
+            if (
+                self.last_login_at is None
+                or now - self.last_login_at >= LAST_LOGIN_UPDATE_INTERVAL
+            ):
+                self.last_login_at = now
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Successful login for user %s", self.username)
         else:
-            # Increment failed login attempts
-            current_attempts = int(self.failed_login_attempts or "0")
-            self.failed_login_attempts = str(current_attempts + 1)
+            attempts = self._increment_failed_login_attempts()
 
             # Lock account after 5 failed attempts for 30 minutes
-            if current_attempts + 1 >= 5:
-                from datetime import timedelta
-
-                self.locked_until = datetime.utcnow() + timedelta(minutes=30)
+            if attempts >= 5:
+                self.locked_until = _now() + timedelta(minutes=30)
                 logger.warning(
-                    f"Account locked for user {self.username} due to failed login attempts"
+                    "Account locked for user %s due to failed login attempts",
+                    self.username,
                 )
             else:
                 logger.warning(
-                    f"Failed login attempt for user {self.username} (attempt {current_attempts + 1})"
+                    "Failed login attempt for user %s (attempt %d)",
+                    self.username,
+                    attempts,
                 )
 
         return is_valid
 
+    def _increment_failed_login_attempts(self) -> int:
+        """
+        Count one failed login attempt.
+
+        For stored users the increment is a single atomic UPDATE, so
+        concurrent failures from other workers are not lost, and the
+        resulting count is read back from the database.
+
+        Returns:
+            int: Failed login attempts including this one
+        """
+        if not inspect(self).persistent:
+            self.failed_login_attempts = (self.failed_login_attempts or 0) + 1
+            return self.failed_login_attempts
+
+        stmt = (
+            update(User)
+            .where(User.id == self.id)
+            .values(
+                failed_login_attempts=func.coalesce(User.failed_login_attempts, 0) + 1
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if db.session.get_bind().dialect.update_returning:
+            attempts = db.session.execute(
+                stmt.returning(User.failed_login_attempts)
+            ).scalar_one()
+        else:
+            db.session.execute(stmt)
+            attempts = db.session.execute(
+                select(User.failed_login_attempts).where(User.id == self.id)
+            ).scalar_one()
+
+        # Record the database value without marking the attribute dirty
+        set_committed_value(self, "failed_login_attempts", attempts)
+        return attempts
+
     def is_account_locked(self) -> bool:
         """
         Check if user account is currently locked.
@@ -160,70 +577,81 @@ class User(BaseModel, ValidationMixin):
         if not self.locked_until:
             return False
 
-        if datetime.utcnow() > self.locked_until:
+        if _now() > self.locked_until:
             # Lock has expired, clear it
             self.locked_until = None
-            self.failed_login_attempts = "0"
+            self.failed_login_attempts = 0
             return False
 
         return True
 
+    def is_lock_active(self) -> bool:
+        """
+        Check if the account lock is in force, without clearing an expired one.
+
+        Use this on read paths, which must not modify the user.
+
+        Returns:
+            bool: True if locked_until is set and still in the future
+        """
+        return self.locked_until is not None and _now() <= self.locked_until
+
     def unlock_account(self) -> None:
         """
         Manually unlock user account and reset failed login attempts.
         """
         self.locked_until = None
-        self.failed_login_attempts = "0"
-        logger.info(f"Account manually unlocked for user {self.username}")
+        self.failed_login_attempts = 0
+        logger.info("Account manually unlocked for user %s", self.username)
 
     def activate(self) -> None:
         """
         Activate user account.
         """
         self.is_active = True
-        logger.info(f"Account activated for user {self.username}")
+        logger.info("Account activated for user %s", self.username)
 
     def deactivate(self) -> None:
         """
         Deactivate user account.
         """
         self.is_active = False
-        logger.info(f"Account deactivated for user {self.username}")
+        logger.info("Account deactivated for user %s", self.username)
 
     def verify_email(self) -> None:
         """
         Mark user email as verified.
         """
         self.is_verified = True
-        self.email_verified_at = datetime.utcnow()
+        self.email_verified_at = _now()
         self.email_verification_token = None
-        logger.info(f"Email verified for user {self.username}")
+        logger.info("Email verified for user %s", self.username)
 
     def set_email_verification_token(self, token: str) -> None:
         """
         Set email verification token.
 
+        Only a SHA-256 digest of the token is stored.
+
         Args:
             token (str): Email verification token
         """
-        self.email_verification_token = token
-        logger.info(f"Email verification token set for user {self.username}")
+        self.email_verification_token = _hash_token(token)
+        logger.info("Email verification token set for user %s", self.username)
 
     def set_password_reset_token(self, token: str, expires_in_hours: int = 24) -> None:
         """
         Set password reset token with expiration.
 
+        Only a SHA-256 digest of the token is stored.
+
         Args:
             token (str): Password reset token
             expires_in_hours (int): Token expiration time in hours (default: 24)
         """
-        from datetime import timedelta
-
-        self.password_reset_token = token
-        self.password_reset_expires_at = datetime.utcnow() + timedelta(
-            hours=expires_in_hours
-        )
-        logger.info(f"Password reset token set for user {self.username}")
+        self.password_reset_token = _hash_token(token)
+        self.password_reset_expires_at = _now() + timedelta(hours=expires_in_hours)
+        logger.info("Password reset token set for user %s", self.username)
 
     def clear_password_reset_token(self) -> None:
         """
@@ -231,7 +659,7 @@ class User(BaseModel, ValidationMixin):
         """
         self.password_reset_token = None
         self.password_reset_expires_at = None
-        logger.info(f"Password reset token cleared for user {self.username}")
+        logger.info("Password reset token cleared for user %s", self.username)
 
     def is_password_reset_token_valid(self, token: str) -> bool:
         """
@@ -246,10 +674,10 @@ class User(BaseModel, ValidationMixin):
         if not self.password_reset_token or not self.password_reset_expires_at:
             return False
 
-        if self.password_reset_token != token:
+        if not hmac.compare_digest(self.password_reset_token, _hash_token(token)):
             return False
 
-        if datetime.utcnow() > self.password_reset_expires_at:
+        if _now() > self.password_reset_expires_at:
             # Token has expired, clear it
             self.clear_password_reset_token()
             return False
@@ -263,14 +691,22 @@ class User(BaseModel, ValidationMixin):
         Returns:
             str: Full name or username if names are not set
         """
-        if self.first_name and self.last_name:
-            return f"{self.first_name} {self.last_name}"
-        elif self.first_name:
-            return self.first_name
-        elif self.last_name:
-            return self.last_name
-        else:
-            return self.username
+        return self._stored_full_name() or self.username
+
+    def _stored_full_name(self) -> Optional[str]:
+        """
+        Get the full name, preferring the database-generated column.
+
+        The column is only current for persistent rows without pending
+        changes; otherwise the name is computed from the name fields.
+
+        Returns:
+            str or None: Full name, None if neither name part is set
+        """
+        state = self._sa_instance_state
+        if state.key is None or state.modified:
+            return _full_name(self.first_name, self.last_name)
+        return self.full_name
 
     def get_display_name(self) -> str:
         """
@@ -279,41 +715,39 @@ class User(BaseModel, ValidationMixin):
         Returns:
             str: Display name (full name or username)
         """
-        full_name = self.get_full_name()
-        return full_name if full_name != self.username else f"@{self.username}"
+        return _display_name(self.get_full_name(), self.username)
 
     def to_dict(
-        self, include_relationships: bool = False, exclude_fields: Optional[list] = None
+        self,
+        include_relationships: bool = False,
+        exclude_fields: Optional[Iterable[str]] = None,
     ) -> Dict[str, Any]:
         """
         Convert User instance to dictionary, excluding sensitive fields by default.
 
         Args:
             include_relationships (bool): Whether to include relationship data
-            exclude_fields (list, optional): Additional fields to exclude
+            exclude_fields (Iterable[str], optional): Additional fields to exclude
 
         Returns:
             Dict[str, Any]: Dictionary representation of the user
         """
         # Always exclude sensitive fields
-        default_exclude = [
-            "password_hash",
-            "email_verification_token",
-            "password_reset_token",
-            "failed_login_attempts",
-        ]
-
-        if exclude_fields:
-            default_exclude.extend(exclude_fields)
+        exclude = (
+            _SENSITIVE_FIELDS.union(exclude_fields)
+            if exclude_fields
+            else _SENSITIVE_FIELDS
+        )
 
         user_dict = super().to_dict(
-            include_relationships=include_relationships, exclude_fields=default_exclude
+            include_relationships=include_relationships, exclude_fields=exclude
         )
 
-        # Add computed fields
-        user_dict["full_name"] = self.get_full_name()
-        user_dict["display_name"] = self.get_display_name()
-        user_dict["is_locked"] = self.is_account_locked()
+        # Add computed fields (the full name is computed once for both)
+        full_name = self.get_full_name()
+        user_dict["full_name"] = full_name
+        user_dict["display_name"] = _display_name(full_name, self.username)
+        user_dict["is_locked"] = self.is_lock_active()
 
         return user_dict
 
@@ -324,13 +758,17 @@ class User(BaseModel, ValidationMixin):
         Returns:
             Dict[str, Any]: Public dictionary representation
         """
+        username = self.username
+        created_at = self.created_at
         return {
             "id": self.id,
-            "username": self.username,
-            "display_name": self.get_display_name(),
+            "username": username,
+            "display_name": _display_name(
+                self._stored_full_name() or username, username
+            ),
             "is_active": self.is_active,
             "is_verified": self.is_verified,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": created_at.isoformat() if created_at else None,
         }
 
     def _validate_custom(self) -> None:
@@ -352,9 +790,7 @@ class User(BaseModel, ValidationMixin):
         self.validate_email_format("email")
 
         # Validate username format (alphanumeric and underscores only)
-        import re
-
-        if not re.match(r"^[a-zA-Z0-9_]+$", self.username):
+        if not _USERNAME_RE.match(self.username):
             raise ValueError(
                 "Username can only contain letters, numbers, and underscores"
             )
@@ -364,12 +800,12 @@ class User(BaseModel, ValidationMixin):
             self.validate_unique_field("username")
             self.validate_unique_field("email")
         else:  # Existing record - check if fields changed
-            original = User.get_by_id(self.id)
-            if original:
-                if original.username != self.username:
-                    self.validate_unique_field("username", exclude_id=self.id)
-                if original.email != self.email:
-                    self.validate_unique_field("email", exclude_id=self.id)
+            # The session's attribute history knows what changed since load
+            attrs = inspect(self).attrs
+            if attrs.username.history.has_changes():
+                self.validate_unique_field("username", exclude_id=self.id)
+            if attrs.email.history.has_changes():
+                self.validate_unique_field("email", exclude_id=self.id)
 
     @validates("email")
     def validate_email(self, key, email):
@@ -404,56 +840,157 @@ class User(BaseModel, ValidationMixin):
         return username
 
     @classmethod
-    def get_by_id(cls, user_id: int):
+    def get_by_id(cls, user_id: int, columns: Optional[List[str]] = None):
         """
         Get user by ID.
 
         Args:
             user_id (int): User ID to search for
+            columns (List[str], optional): Only load these columns
 
         Returns:
             User or None: User instance if found, None otherwise
+
+        Raises:
+            SQLAlchemyError: If the database query fails
         """
-        try:
-            return cls.query.get(user_id)
-        except Exception as e:
-            logger.error(f"Failed to get user by ID {user_id}: {e}")
-            return None
+        return db.session.get(cls, user_id, options=cls._load_only(columns))
 
     @classmethod
-    def get_by_username(cls, username: str):
+    def _login_query(cls, with_password: bool):
+        """
+        Build the base query for single-user lookups.
+
+        Args:
+            with_password (bool): Undefer ``password_hash``
+
+        Returns:
+            Query: User query
+        """
+        if with_password:
+            return cls.query.options(undefer(cls.password_hash))
+        return cls.query
+
+    @classmethod
+    def get_by_username(cls, username: str, with_password: bool = False):
         """
         Get user by username.
 
         Args:
             username (str): Username to search for
+            with_password (bool): Load the deferred password hash in the same query
 
         Returns:
             User or None: User instance if found, None otherwise
         """
+        username = username.lower().strip()
+        user = _get_memoized_user("username", username)
+        if user is not None:
+            return user
         try:
-            return cls.query.filter_by(username=username.lower().strip()).first()
+            return _memoize_user(
+                cls._login_query(with_password).filter_by(username=username).first()
+            )
         except Exception as e:
-            logger.error(f"Failed to get user by username {username}: {e}")
+            logger.error("Failed to get user by username %s: %s", username, e)
             return None
 
     @classmethod
-    def get_by_email(cls, email: str):
+    def get_by_email(cls, email: str, with_password: bool = False):
         """
         Get user by email address.
 
         Args:
             email (str): Email address to search for
+            with_password (bool): Load the deferred password hash in the same query
 
         Returns:
             User or None: User instance if found, None otherwise
         """
+        email = email.lower().strip()
+        user = _get_memoized_user("email", email)
+        if user is not None:
+            return user
         try:
-            return cls.query.filter_by(email=email.lower().strip()).first()
+            return _memoize_user(
+                cls._login_query(with_password).filter_by(email=email).first()
+            )
         except Exception as e:
-            logger.error(f"Failed to get user by email {email}: {e}")
+            logger.error("Failed to get user by email %s: %s", email, e)
             return None
 
+    @classmethod
+    def get_by_password_reset_token(cls, token: str):
+        """
+        Get user by password reset token.
+
+        Args:
+            token (str): Raw password reset token
+
+        Returns:
+            User or None: User instance if found, None otherwise
+        """
+        token_hash = _hash_token(token)
+        user = _get_memoized_user("password_reset_token", token_hash)
+        if user is not None:
+            return user
+        return _memoize_user(
+            cls.query.filter_by(password_reset_token=token_hash).first()
+        )
+
+    @classmethod
+    def get_by_login(cls, username_or_email: str, with_password: bool = False):
+        """
+        Get user by username or email address in a single query.
+
+        Identifiers containing ``@`` can only be email addresses; anything
+        else is matched against both columns with one ``OR`` condition.
+
+        Args:
+            username_or_email (str): Username or email address to search for
+            with_password (bool): Load the deferred password hash in the same query
+
+        Returns:
+            User or None: User instance if found, None otherwise
+        """
+        login = username_or_email.lower().strip()
+        if "@" in login:
+            user = _get_memoized_user("email", login)
+            condition = cls.email == login
+        else:
+            user = _get_memoized_user("username", login) or _get_memoized_user(
+                "email", login
+            )
+            condition = or_(cls.username == login, cls.email == login)
+        if user is not None:
+            return user
+        try:
+            return _memoize_user(
+                cls._login_query(with_password).filter(condition).first()
+            )
+        except Exception as e:
+            logger.error("Failed to get user by login %s: %s", username_or_email, e)
+            return None
+
+    @classmethod
+    def get_by_email_verification_token(cls, token: str):
+        """
+        Get user by email verification token.
+
+        Args:
+            token (str): Raw email verification token
+
+        Returns:
+            User or None: User instance if found, None otherwise
+        """
+        token_hash = _hash_token(token)
+        user = _get_memoized_user("email_verification_token", token_hash)
+        if user is not None:
+            return user
+        return _memoize_user(
+            cls.query.filter_by(email_verification_token=token_hash).first()
+        )
+
     @classmethod
     def get_active_users(
         cls, limit: Optional[int] = None, offset: Optional[int] = None
@@ -476,7 +1013,7 @@ class User(BaseModel, ValidationMixin):
                 query = query.limit(limit)
             return query.all()
         except Exception as e:
-            logger.error(f"Failed to get active users: {e}")
+            logger.error("Failed to get active users: %s", e)
             return []
 
     @classmethod
@@ -501,34 +1038,71 @@ class User(BaseModel, ValidationMixin):
                 query = query.limit(limit)
             return query.all()
         except Exception as e:
-            logger.error(f"Failed to get verified users: {e}")
+            logger.error("Failed to get verified users: %s", e)
             return []
 
     @classmethod
-    def search_users(cls, search_term: str, limit: Optional[int] = None):
+    def search_condition(cls, search_term: str, prefix_only: bool = False):
+        """
+        Build the filter used to search users.
+
+        Prefix searches match the start of the username or email. Both are
+        stored lowercased, so a plain LIKE on the lowered term is
+        case-insensitive and can use a btree index. Substring searches run a
+        single LIKE against ``search_blob``, the lowercased username, email
+        and names separated by a control character, so a match never spans
+        two columns. ``%`` and ``_`` in the term match literally in both modes.
+
+        Args:
+            search_term (str): Term to search for
+            prefix_only (bool): Only match usernames/emails starting with the term
+
+        Returns:
+            ColumnElement: SQL filter condition
+        """
+        term = search_term.lower()
+        escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        if prefix_only:
+            prefix_pattern = f"{escaped}%"
+            return or_(
+                cls.username.like(prefix_pattern, escape="\\"),
+                cls.email.like(prefix_pattern, escape="\\"),
+            )
+
+        if _SEARCH_BLOB_SEPARATOR in term:
+            return false()
+        return cls.search_blob.like(f"%{escaped}%", escape="\\")
+
+    @classmethod
+    def search_users(
+        cls, search_term: str, limit: Optional[int] = None, prefix_only: bool = False
+    ):
         """
         Search users by username, email, or name.
 
         Args:
             search_term (str): Term to search for
             limit (int, optional): Maximum number of results to return
+            prefix_only (bool): Only match usernames/emails starting with the term
 
         Returns:
             List[User]: List of matching user instances
         """
         try:
-            search_pattern = f"%{search_term.lower()}%"
-            query = cls.query.filter(
-                (cls.username.ilike(search_pattern))
-                | (cls.email.ilike(search_pattern))
-                | (cls.first_name.ilike(search_pattern))
-                | (cls.last_name.ilike(search_pattern))
-            )
+            query = cls.query.filter(cls.search_condition(search_term, prefix_only))
 
             if limit:
                 query = query.limit(limit)
 
             return query.all()
         except Exception as e:
-            logger.error(f"Failed to search users with term '{search_term}': {e}")
+            logger.error("Failed to search users with term '%s': %s", search_term, e)
             return []
+
+
+# The trigram indexes need pg_trgm; create it along with the table
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -7,4 +7,5 @@ for request validation, response serialization, and data transformation.
 
 from .auth_schemas import *
 from .common_schemas import *
+from .registry import *
 from .user_schemas import *
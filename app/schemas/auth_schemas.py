@@ -37,7 +37,7 @@ class LoginRequestSchema(Schema):
         description="User password",
     )
     remember_me = fields.Bool(
-        missing=False, description="Whether to create longer-lived tokens"
+        load_default=False, description="Whether to create longer-lived tokens"
     )
 
     @post_load
@@ -256,3 +256,12 @@ class EmailVerificationDataSchema(Schema):
     """Schema for email verification response data."""
 
     user = fields.Nested("UserResponseSchema", description="Updated user information")
+
+
+# Shared request schema instances; schemas are safe to reuse across requests
+login_request_schema = LoginRequestSchema()
+register_request_schema = RegisterRequestSchema()
+password_reset_request_schema = PasswordResetRequestSchema()
+password_reset_schema = PasswordResetSchema()
+change_password_schema = ChangePasswordSchema()
+email_verification_schema = EmailVerificationSchema()
@@ -5,9 +5,54 @@ This module contains schemas for common data structures used across
 multiple endpoints, such as pagination, error responses, and base models.
 """
 
+import re
 from datetime import datetime
+from functools import lru_cache
 
-from marshmallow import EXCLUDE, Schema, ValidationError, fields, post_load, validate
+from marshmallow import EXCLUDE, Schema, ValidationError, fields, validate
+
+from app.utils.json_provider import ORJSONRenderModule
+
+# Username must start with letter, contain only letters, numbers, underscores, hyphens
+_USERNAME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9_-]*$")
+
+# Names should contain only letters, spaces, hyphens, and apostrophes
+_NAME_RE = re.compile(r"^[a-zA-Z\s\-']+$")
+
+# Characters that count as special in validate_password_strength
+_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+# Usernames that cannot be registered
+_RESERVED_USERNAMES = frozenset(
+    (
+        "admin",
+        "administrator",
+        "root",
+        "system",
+        "api",
+        "www",
+        "mail",
+        "email",
+        "support",
+        "help",
+        "info",
+        "contact",
+        "service",
+        "user",
+        "guest",
+        "anonymous",
+        "null",
+        "undefined",
+        "test",
+        "demo",
+        "example",
+    )
+)
+
+# This is an example - you might want to implement domain whitelist/blacklist
+_BLOCKED_EMAIL_DOMAINS = frozenset(
+    ("tempmail.com", "10minutemail.com", "guerrillamail.com")
+)
 
 
 class PaginationSchema(Schema):
@@ -15,22 +60,17 @@ class PaginationSchema(Schema):
 
     page = fields.Int(
         validate=validate.Range(min=1, error="Page must be at least 1"),
-        missing=1,
+        load_default=1,
         description="Page number",
     )
     per_page = fields.Int(
         validate=validate.Range(
             min=1, max=100, error="Per page must be between 1 and 100"
         ),
-        missing=20,
+        load_default=20,
         description="Items per page",
     )
 
-    @post_load
-    def make_pagination(self, data, **kwargs):
-        """Post-process pagination data."""
-        return data
-
 
 class SortingSchema(Schema):
     """Schema for sorting parameters."""
@@ -47,14 +87,14 @@ class SortingSchema(Schema):
             ],
             error="Invalid sort field",
         ),
-        missing="created_at",
+        load_default="created_at",
         description="Field to sort by",
     )
     sort_order = fields.Str(
         validate=validate.OneOf(
             ["asc", "desc"], error="Sort order must be 'asc' or 'desc'"
         ),
-        missing="desc",
+        load_default="desc",
         description="Sort order",
     )
 
@@ -70,7 +110,7 @@ class SearchSchema(Schema):
         description="Search term",
     )
     include_inactive = fields.Bool(
-        missing=False, description="Include inactive records"
+        load_default=False, description="Include inactive records"
     )
 
 
@@ -79,8 +119,18 @@ class ErrorResponseSchema(Schema):
 
     error = fields.Str(required=True, description="Error message")
     code = fields.Str(required=True, description="Error code")
-    details = fields.Raw(allow_none=True, description="Additional error details")
-    timestamp = fields.DateTime(missing=datetime.utcnow, description="Error timestamp")
+    details = fields.Dict(
+        keys=fields.Str(),
+        values=fields.Raw(),
+        allow_none=True,
+        description="Additional error details",
+    )
+    timestamp = fields.DateTime(
+        format="iso",
+        load_default=datetime.utcnow,
+        dump_default=datetime.utcnow,
+        description="Error timestamp (ISO 8601, UTC)",
+    )
 
 
 class SuccessResponseSchema(Schema):
@@ -90,7 +140,43 @@ class SuccessResponseSchema(Schema):
     message = fields.Str(allow_none=True, description="Success message")
     data = fields.Raw(allow_none=True, description="Response data")
     timestamp = fields.DateTime(
-        missing=datetime.utcnow, description="Response timestamp"
+        format="iso",
+        load_default=datetime.utcnow,
+        dump_default=datetime.utcnow,
+        description="Response timestamp (ISO 8601, UTC)",
+    )
+
+
+@lru_cache(maxsize=None)
+def response_envelope(payload_schema, require_message: bool = False):
+    """
+    Build the ``{"success", "message", "data"}`` envelope schema for a payload.
+
+    Classes are cached, so each payload schema gets exactly one envelope.
+
+    Args:
+        payload_schema: Schema class describing ``data``
+        require_message (bool): Whether ``message`` is required
+
+    Returns:
+        type: Envelope schema class
+    """
+    name = payload_schema.__name__
+    if name.endswith("Schema"):
+        name = name[: -len("Schema")]
+    return Schema.from_dict(
+        {
+            "success": fields.Bool(
+                required=True, description="Operation success status"
+            ),
+            "message": fields.Str(
+                required=require_message, description="Response message"
+            ),
+            "data": fields.Nested(
+                payload_schema, required=True, description="Response data"
+            ),
+        },
+        name=f"{name}EnvelopeSchema",
     )
 
 
@@ -100,7 +186,12 @@ class ValidationErrorSchema(Schema):
     error = fields.Str(required=True, description="Error message")
     code = fields.Str(required=True, description="Error code")
     details = fields.Dict(required=True, description="Validation error details")
-    timestamp = fields.DateTime(missing=datetime.utcnow, description="Error timestamp")
+    timestamp = fields.DateTime(
+        format="iso",
+        load_default=datetime.utcnow,
+        dump_default=datetime.utcnow,
+        description="Error timestamp (ISO 8601, UTC)",
+    )
 
 
 class BaseModelSchema(Schema):
@@ -113,8 +204,9 @@ class BaseModelSchema(Schema):
     class Meta:
         """Schema metadata."""
 
-        ordered = True
+        ordered = False  # Plain dicts keep declaration order on Python 3.7+
         unknown = EXCLUDE  # Exclude unknown fields
+        render_module = ORJSONRenderModule  # dumps()/loads() via orjson
 
 
 class TimestampMixin:
@@ -138,18 +230,28 @@ def validate_password_strength(password):
     if len(password) < 8:
         raise ValidationError("Password must be at least 8 characters long")
 
-    if not any(c.isupper() for c in password):
+    # Classify every character in one pass
+    has_upper = has_lower = has_digit = has_special = False
+    for c in password:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+        elif c in _SPECIAL_CHARS:
+            has_special = True
+
+    if not has_upper:
         raise ValidationError("Password must contain at least one uppercase letter")
 
-    if not any(c.islower() for c in password):
+    if not has_lower:
         raise ValidationError("Password must contain at least one lowercase letter")
 
-    if not any(c.isdigit() for c in password):
+    if not has_digit:
         raise ValidationError("Password must contain at least one digit")
 
-    # Check for special characters
-    special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-    if not any(c in special_chars for c in password):
+    if not has_special:
         raise ValidationError("Password must contain at least one special character")
 
 
@@ -163,41 +265,13 @@ def validate_username_format(username):
     Raises:
         ValidationError: If username format is invalid
     """
-    import re
-
-    # Username must start with letter, contain only letters, numbers, underscores, hyphens
-    pattern = r"^[a-zA-Z][a-zA-Z0-9_-]*$"
-    if not re.match(pattern, username):
+    if not _USERNAME_RE.match(username):
         raise ValidationError(
             "Username must start with a letter and contain only letters, numbers, underscores, and hyphens"
         )
 
     # Check for reserved usernames
-    reserved_usernames = [
-        "admin",
-        "administrator",
-        "root",
-        "system",
-        "api",
-        "www",
-        "mail",
-        "email",
-        "support",
-        "help",
-        "info",
-        "contact",
-        "service",
-        "user",
-        "guest",
-        "anonymous",
-        "null",
-        "undefined",
-        "test",
-        "demo",
-        "example",
-    ]
-
-    if username.lower() in reserved_usernames:
+    if username.lower() in _RESERVED_USERNAMES:
         raise ValidationError("This username is reserved and cannot be used")
 
 
@@ -211,11 +285,11 @@ def validate_email_domain(email):
     Raises:
         ValidationError: If email domain is not allowed
     """
-    # This is an example - you might want to implement domain whitelist/blacklist
-    blocked_domains = ["tempmail.com", "10minutemail.com", "guerrillamail.com"]
+    at = email.rfind("@")
+    if at < 0:
+        return
 
-    domain = email.split("@")[1].lower() if "@" in email else ""
-    if domain in blocked_domains:
+    if email[at + 1 :].lower() in _BLOCKED_EMAIL_DOMAINS:
         raise ValidationError("Email domain is not allowed")
 
 
@@ -229,11 +303,7 @@ def validate_name_format(name):
     Raises:
         ValidationError: If name format is invalid
     """
-    import re
-
-    # Names should contain only letters, spaces, hyphens, and apostrophes
-    pattern = r"^[a-zA-Z\s\-']+$"
-    if not re.match(pattern, name):
+    if not _NAME_RE.match(name):
         raise ValidationError(
             "Name can only contain letters, spaces, hyphens, and apostrophes"
         )
@@ -245,6 +315,24 @@ def validate_name_format(name):
         )
 
 
+# Validator chains shared by every instance of the custom fields below;
+# validators are stateless, and each field copies the sequence into its own list
+_USERNAME_VALIDATORS = (
+    validate.Length(
+        min=3, max=80, error="Username must be between 3 and 80 characters"
+    ),
+    validate_username_format,
+)
+_EMAIL_VALIDATORS = (
+    validate.Length(max=120, error="Email must be at most 120 characters"),
+    validate_email_domain,
+)
+_NAME_VALIDATORS = (
+    validate.Length(min=1, max=50, error="Name must be between 1 and 50 characters"),
+    validate_name_format,
+)
+
+
 # Custom fields
 class PasswordField(fields.Str):
     """Custom field for password validation."""
@@ -258,40 +346,18 @@ class UsernameField(fields.Str):
     """Custom field for username validation."""
 
     def __init__(self, **kwargs):
-        super().__init__(
-            validate=[
-                validate.Length(
-                    min=3, max=80, error="Username must be between 3 and 80 characters"
-                ),
-                validate_username_format,
-            ],
-            **kwargs,
-        )
+        super().__init__(validate=_USERNAME_VALIDATORS, **kwargs)
 
 
 class EmailField(fields.Email):
     """Custom field for email validation."""
 
     def __init__(self, **kwargs):
-        super().__init__(
-            validate=[
-                validate.Length(max=120, error="Email must be at most 120 characters"),
-                validate_email_domain,
-            ],
-            **kwargs,
-        )
+        super().__init__(validate=_EMAIL_VALIDATORS, **kwargs)
 
 
 class NameField(fields.Str):
     """Custom field for name validation."""
 
     def __init__(self, **kwargs):
-        super().__init__(
-            validate=[
-                validate.Length(
-                    min=1, max=50, error="Name must be between 1 and 50 characters"
-                ),
-                validate_name_format,
-            ],
-            **kwargs,
-        )
+        super().__init__(validate=_NAME_VALIDATORS, **kwargs)
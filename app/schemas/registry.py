@@ -0,0 +1,81 @@
+"""
+Shared schema instance registry.
+
+Building a Marshmallow schema binds and copies every declared field, so
+helpers that receive a schema class look instances up here instead of
+constructing one per call.
+"""
+
+from functools import lru_cache
+from typing import Iterable, Optional, Sequence, Type, Union
+
+from marshmallow import Schema
+
+__all__ = ["get_schema"]
+
+
+def _normalize_fields(names: Optional[Iterable[str]]) -> Optional[tuple]:
+    """
+    Turn a field name collection into a hashable, order-independent key.
+
+    Args:
+        names (Iterable[str], optional): Field names
+
+    Returns:
+        tuple or None: Sorted field names, None if not given
+    """
+    if names is None:
+        return None
+    return tuple(sorted(names))
+
+
+@lru_cache(maxsize=256)
+def _cached_schema(schema_class, only, exclude, partial, many) -> Schema:
+    """
+    Build the schema instance for one normalized argument combination.
+
+    Args:
+        schema_class: Marshmallow schema class
+        only (tuple, optional): Fields to include
+        exclude (tuple): Fields to exclude
+        partial (bool or tuple): Partial loading setting
+        many (bool): Whether the schema handles collections
+
+    Returns:
+        Schema: New schema instance
+    """
+    return schema_class(only=only, exclude=exclude, partial=partial, many=many)
+
+
+def get_schema(
+    schema_class: Type[Schema],
+    only: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    partial: Union[bool, Sequence[str]] = False,
+    many: bool = False,
+) -> Schema:
+    """
+    Get a shared schema instance for the given options.
+
+    Instances are reused across calls and requests, so callers must not
+    mutate them (for example by setting ``context``).
+
+    Args:
+        schema_class: Marshmallow schema class
+        only (Iterable[str], optional): Fields to include
+        exclude (Iterable[str], optional): Fields to exclude
+        partial (bool or Sequence[str]): Allow missing required fields
+        many (bool): Whether the schema handles collections
+
+    Returns:
+        Schema: Schema instance
+    """
+    if not isinstance(partial, bool):
+        partial = _normalize_fields(partial)
+    return _cached_schema(
+        schema_class,
+        _normalize_fields(only),
+        _normalize_fields(exclude) or (),
+        partial,
+        many,
+    )
@@ -24,8 +24,64 @@ from .common_schemas import (
     SortingSchema,
     TimestampMixin,
     UsernameField,
+    response_envelope,
 )
 
+# Request fields normalized after loading, with the case conversion to apply
+_NORMALIZED_USER_FIELDS = (
+    ("email", str.lower),
+    ("username", str.lower),
+    ("first_name", str.title),
+    ("last_name", str.title),
+)
+
+
+def _normalize_user_fields(data):
+    """
+    Strip and case-normalize the identity and name fields present in data.
+
+    Emails and usernames are lowercased and names title-cased; empty and
+    missing values are left as they are.
+
+    Args:
+        data (dict): Loaded request data, updated in place
+    """
+    for key, convert in _NORMALIZED_USER_FIELDS:
+        value = data.get(key)
+        if value:
+            data[key] = convert(value.strip())
+
+
+def _dump_full_name(obj):
+    """
+    Join the first and last name of a user, skipping missing parts.
+
+    Args:
+        obj: Object being serialized
+
+    Returns:
+        str or None: Full name, None if neither part is set
+    """
+    first_name = getattr(obj, "first_name", None)
+    last_name = getattr(obj, "last_name", None)
+    if first_name and last_name:
+        return f"{first_name} {last_name}"
+    return first_name or last_name or None
+
+
+def _dump_is_locked(obj):
+    """
+    Check whether a user account is locked.
+
+    Args:
+        obj: Object being serialized
+
+    Returns:
+        bool: True if the object reports a locked account
+    """
+    is_lock_active = getattr(obj, "is_lock_active", None)
+    return is_lock_active() if is_lock_active is not None else False
+
 
 class UserResponseSchema(BaseModelSchema, TimestampMixin):
     """Schema for user response serialization."""
@@ -45,21 +101,12 @@ class UserResponseSchema(BaseModelSchema, TimestampMixin):
     )
 
     # Computed fields
-    full_name = fields.Method("get_full_name", description="Full name")
-    is_locked = fields.Method("get_is_locked", description="Whether account is locked")
-
-    def get_full_name(self, obj):
-        """Get user's full name."""
-        if hasattr(obj, "first_name") and hasattr(obj, "last_name"):
-            parts = [obj.first_name, obj.last_name]
-            return " ".join(filter(None, parts)) or None
-        return None
-
-    def get_is_locked(self, obj):
-        """Check if account is locked."""
-        if hasattr(obj, "is_account_locked"):
-            return obj.is_account_locked()
-        return False
+    full_name = fields.Function(
+        _dump_full_name, dump_only=True, description="Full name"
+    )
+    is_locked = fields.Function(
+        _dump_is_locked, dump_only=True, description="Whether account is locked"
+    )
 
 
 class CreateUserRequestSchema(Schema):
@@ -80,33 +127,22 @@ class CreateUserRequestSchema(Schema):
         allow_none=True,
         description="User biography (max 500 characters)",
     )
-    is_admin = fields.Bool(missing=False, description="Whether user should be admin")
+    is_admin = fields.Bool(
+        load_default=False, description="Whether user should be admin"
+    )
     is_verified = fields.Bool(
-        missing=False, description="Whether email should be pre-verified"
+        load_default=False, description="Whether email should be pre-verified"
     )
 
-    @validates_schema
-    def validate_create_user_data(self, data, **kwargs):
-        """Validate user creation data."""
-        # Additional cross-field validation can be added here
-        pass
-
     @post_load
     def process_create_user_data(self, data, **kwargs):
         """Process user creation data after validation."""
-        # Normalize email and username
-        data["email"] = data["email"].strip().lower()
-        data["username"] = data["username"].strip().lower()
-
-        # Capitalize names if provided
-        if data.get("first_name"):
-            data["first_name"] = data["first_name"].strip().title()
-        if data.get("last_name"):
-            data["last_name"] = data["last_name"].strip().title()
+        _normalize_user_fields(data)
 
         # Clean bio
-        if data.get("bio"):
-            data["bio"] = data["bio"].strip()
+        bio = data.get("bio")
+        if bio:
+            data["bio"] = bio.strip()
 
         return data
 
@@ -138,27 +174,19 @@ class UpdateUserRequestSchema(Schema):
     @validates_schema
     def validate_update_user_data(self, data, **kwargs):
         """Validate user update data."""
-        if not any(data.values()):
+        # Only provided fields are present, so False/None values still count
+        if not data:
             raise ValidationError("At least one field must be provided for update")
 
     @post_load
     def process_update_user_data(self, data, **kwargs):
         """Process user update data after validation."""
-        # Normalize email and username if provided
-        if data.get("email"):
-            data["email"] = data["email"].strip().lower()
-        if data.get("username"):
-            data["username"] = data["username"].strip().lower()
-
-        # Capitalize names if provided
-        if data.get("first_name"):
-            data["first_name"] = data["first_name"].strip().title()
-        if data.get("last_name"):
-            data["last_name"] = data["last_name"].strip().title()
+        _normalize_user_fields(data)
 
         # Clean bio if provided
-        if data.get("bio") is not None:
-            data["bio"] = data["bio"].strip() if data["bio"] else None
+        bio = data.get("bio")
+        if bio is not None:
+            data["bio"] = bio.strip() if bio else None
 
         return data
 
@@ -181,7 +209,7 @@ class UserSearchSchema(SearchSchema):
     )
     limit = fields.Int(
         validate=validate.Range(min=1, max=50, error="Limit must be between 1 and 50"),
-        missing=20,
+        load_default=20,
         description="Maximum results (max 50)",
     )
 
@@ -192,15 +220,6 @@ class SetAdminStatusSchema(Schema):
     is_admin = fields.Bool(required=True, description="Whether user should be admin")
 
 
-class UserListResponseSchema(Schema):
-    """Schema for user list response serialization."""
-
-    success = fields.Bool(required=True, description="Operation success status")
-    data = fields.Nested(
-        "UserListDataSchema", required=True, description="User list response data"
-    )
-
-
 class UserListDataSchema(Schema):
     """Schema for user list response data."""
 
@@ -225,16 +244,6 @@ class PaginationInfoSchema(Schema):
     has_next = fields.Bool(required=True, description="Whether there is a next page")
 
 
-class UserSingleResponseSchema(Schema):
-    """Schema for single user response serialization."""
-
-    success = fields.Bool(required=True, description="Operation success status")
-    message = fields.Str(description="Response message")
-    data = fields.Nested(
-        "UserDataSchema", required=True, description="User response data"
-    )
-
-
 class UserDataSchema(Schema):
     """Schema for single user response data."""
 
@@ -264,17 +273,6 @@ class UserStatisticsSchema(Schema):
     )
 
 
-class UserStatisticsResponseSchema(Schema):
-    """Schema for user statistics response serialization."""
-
-    success = fields.Bool(required=True, description="Operation success status")
-    data = fields.Nested(
-        "UserStatisticsDataSchema",
-        required=True,
-        description="User statistics response data",
-    )
-
-
 class UserStatisticsDataSchema(Schema):
     """Schema for user statistics response data."""
 
@@ -283,15 +281,6 @@ class UserStatisticsDataSchema(Schema):
     )
 
 
-class UserSearchResponseSchema(Schema):
-    """Schema for user search response serialization."""
-
-    success = fields.Bool(required=True, description="Operation success status")
-    data = fields.Nested(
-        "UserSearchDataSchema", required=True, description="User search response data"
-    )
-
-
 class UserSearchDataSchema(Schema):
     """Schema for user search response data."""
 
@@ -304,18 +293,27 @@ class UserSearchDataSchema(Schema):
     total_results = fields.Int(required=True, description="Total number of results")
 
 
-class UserDeleteResponseSchema(Schema):
-    """Schema for user deletion response serialization."""
-
-    success = fields.Bool(required=True, description="Operation success status")
-    message = fields.Str(required=True, description="Deletion result message")
-    data = fields.Nested(
-        "UserDeleteDataSchema", required=True, description="User deletion response data"
-    )
-
-
 class UserDeleteDataSchema(Schema):
     """Schema for user deletion response data."""
 
     user_id = fields.Int(required=True, description="Deleted user ID")
     soft_delete = fields.Bool(required=True, description="Whether it was a soft delete")
+
+
+# Response envelopes: {"success", "message", "data"} around each payload schema
+UserListResponseSchema = response_envelope(UserListDataSchema)
+UserSingleResponseSchema = response_envelope(UserDataSchema)
+UserStatisticsResponseSchema = response_envelope(UserStatisticsDataSchema)
+UserSearchResponseSchema = response_envelope(UserSearchDataSchema)
+UserDeleteResponseSchema = response_envelope(UserDeleteDataSchema, require_message=True)
+
+
+# Shared schema instances; schemas are safe to reuse across requests
+user_response_schema = UserResponseSchema()
+user_list_schema = UserResponseSchema(many=True)
+create_user_request_schema = CreateUserRequestSchema()
+update_user_request_schema = UpdateUserRequestSchema()
+user_query_schema = UserQuerySchema()
+user_search_schema = UserSearchSchema()
+set_admin_status_schema = SetAdminStatusSchema()
+user_statistics_schema = UserStatisticsSchema()
@@ -1,10 +1,51 @@
 """
 Services package for Flask API Template.
 
-This package contains business logic services.
+This package contains business logic services. Service modules are imported
+on first attribute access, so importing the package alone stays cheap.
 """
 
-from .auth_service import AuthenticationError, AuthService
-from .user_service import UserService, UserServiceError
+from importlib import import_module
 
 __all__ = ["AuthService", "AuthenticationError", "UserService", "UserServiceError"]
+
+# Exported name -> submodule defining it
+_LAZY_EXPORTS = {
+    "AuthService": ".auth_service",
+    "AuthenticationError": ".auth_service",
+    "UserService": ".user_service",
+    "UserServiceError": ".user_service",
+}
+
+
+def __getattr__(name):
+    """
+    Import a service on first access (PEP 562).
+
+    Args:
+        name (str): Attribute name
+
+    Returns:
+        Any: The requested service class or exception
+
+    Raises:
+        AttributeError: If the name is not exported by this package
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """
+    List the package attributes, including not yet imported services.
+
+    Returns:
+        list: Attribute names
+    """
+    return sorted(set(globals()) | set(__all__))
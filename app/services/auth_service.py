@@ -7,7 +7,6 @@ JWT token generation and refresh, password reset, and user registration function
 
 import logging
 import secrets
-import string
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional, Tuple
 
@@ -17,9 +16,8 @@ from flask_jwt_extended import (
     create_refresh_token,
     get_jwt_identity,
 )
-from werkzeug.security import generate_password_hash
 
-from app.extensions import db
+from app.extensions import db, evict_cached_user
 from app.models.user import User
 from app.utils.error_helpers import (
     handle_duplicate_resource,
@@ -102,6 +100,7 @@ class AuthService:
             logger.warning(f"Invalid password for user: {user.username}")
 
             # Save failed attempt (check_password already increments counter)
+            locked = user.locked_until is not None
             try:
                 db.session.commit()
             except Exception as e:
@@ -109,9 +108,16 @@ class AuthService:
                     f"Failed to save login attempt for user {user.username}: {e}"
                 )
                 db.session.rollback()
+            else:
+                if locked:
+                    # Tokens already issued must stop working right away
+                    evict_cached_user(user.id)
 
             raise InvalidCredentialsError()
 
+        # Move legacy (e.g. PBKDF2) hashes to scrypt while the password is known
+        user.rehash_password_if_needed(password)
+
         # Generate tokens
         try:
             tokens = AuthService._generate_tokens(user, remember_me)
@@ -272,6 +278,11 @@ class AuthService:
             db.session.add(user)
             db.session.commit()
 
+            # Imported here so importing auth_service doesn't load user_service
+            from app.services.user_service import UserService
+
+            UserService.invalidate_user_statistics()
+
             logger.info(f"User registered successfully: {user.username}")
 
             return {
@@ -387,7 +398,7 @@ class AuthService:
             )
 
         # Find user with valid reset token
-        user = User.query.filter_by(password_reset_token=token).first()
+        user = User.get_by_password_reset_token(token)
         if not user or not user.is_password_reset_token_valid(token):
             logger.warning("Password reset attempt with invalid or expired token")
             raise AuthenticationError(
@@ -405,6 +416,7 @@ class AuthService:
             user.unlock_account()
 
             db.session.commit()
+            evict_cached_user(user.id)
 
             logger.info(f"Password reset successfully for user: {user.username}")
 
@@ -441,7 +453,7 @@ class AuthService:
             )
 
         # Find user with verification token
-        user = User.query.filter_by(email_verification_token=token).first()
+        user = User.get_by_email_verification_token(token)
         if not user:
             logger.warning("Email verification attempt with invalid token")
             raise AuthenticationError(
@@ -459,6 +471,10 @@ class AuthService:
             user.verify_email()
             db.session.commit()
 
+            from app.services.user_service import UserService
+
+            UserService.invalidate_user_statistics()
+
             logger.info(f"Email verified successfully for user: {user.username}")
 
             return {
@@ -533,6 +549,7 @@ class AuthService:
             # Change password
             user.set_password(new_password)
             db.session.commit()
+            evict_cached_user(user.id)
 
             logger.info(f"Password changed successfully for user: {user.username}")
 
@@ -560,6 +577,9 @@ class AuthService:
         """
         logger.info(f"User logout: {user.username}")
 
+        # Drop cached JWT lookups so the next request re-validates the user
+        evict_cached_user(user.id)
+
         # In a full implementation, you might want to:
         # - Add token to blacklist
         # - Clear refresh tokens from database
@@ -578,15 +598,8 @@ class AuthService:
         Returns:
             Optional[User]: User instance if found, None otherwise
         """
-        # Try to find by email first (contains @)
-        if "@" in username_or_email:
-            return User.get_by_email(username_or_email)
-        else:
-            # Try username first, then email as fallback
-            user = User.get_by_username(username_or_email)
-            if not user:
-                user = User.get_by_email(username_or_email)
-            return user
+        # The password is checked next, so fetch the deferred hash up front
+        return User.get_by_login(username_or_email, with_password=True)
 
     @staticmethod
     def _generate_tokens(user: User, remember_me: bool = False) -> Dict[str, Any]:
@@ -642,5 +655,5 @@ class AuthService:
         Returns:
             str: Secure random token
         """
-        alphabet = string.ascii_letters + string.digits
-        return "".join(secrets.choice(alphabet) for _ in range(length))
+        # One urandom call; each URL-safe base64 character carries 6 bits
+        return secrets.token_urlsafe(length)[:length]
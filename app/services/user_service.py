@@ -6,17 +6,26 @@ user information updates and queries, and user permission management functionali
 """
 
 import logging
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, or_
+from flask import current_app
+from sqlalchemy import and_, case, func, or_
 from sqlalchemy.exc import IntegrityError
 
-from app.extensions import db
+from app.extensions import db, evict_cached_user
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
+# Process-local cache for the user statistics aggregate. "generation" is
+# bumped on every invalidation so a result computed before an invalidation
+# is never stored.
+_statistics_cache = {"stats": None, "expires_at": 0.0, "generation": 0}
+_statistics_lock = threading.Lock()
+
 
 class UserServiceError(Exception):
     """Custom exception for user service errors."""
@@ -300,6 +309,7 @@ class UserService:
             # Add to database
             db.session.add(user)
             db.session.commit()
+            UserService.invalidate_user_statistics()
 
             logger.info(f"User created successfully: {user.username} (ID: {user.id})")
 
@@ -404,6 +414,8 @@ class UserService:
             user.updated_at = datetime.utcnow()
 
             db.session.commit()
+            UserService.invalidate_user_statistics()
+            evict_cached_user(user.id)
 
             logger.info(f"User updated successfully: {user.username} (ID: {user.id})")
 
@@ -473,6 +485,8 @@ class UserService:
                 user.is_active = False
                 user.updated_at = datetime.utcnow()
                 db.session.commit()
+                UserService.invalidate_user_statistics()
+                evict_cached_user(user_id)
 
                 logger.info(f"User soft deleted: {user.username} (ID: {user.id})")
                 message = "User deactivated successfully"
@@ -481,6 +495,8 @@ class UserService:
                 username = user.username
                 db.session.delete(user)
                 db.session.commit()
+                UserService.invalidate_user_statistics()
+                evict_cached_user(user_id)
 
                 logger.info(f"User hard deleted: {username} (ID: {user_id})")
                 message = "User deleted permanently"
@@ -530,6 +546,7 @@ class UserService:
             user.activate()
             user.updated_at = datetime.utcnow()
             db.session.commit()
+            UserService.invalidate_user_statistics()
 
             logger.info(f"User activated: {user.username} (ID: {user.id})")
 
@@ -586,6 +603,8 @@ class UserService:
             user.deactivate()
             user.updated_at = datetime.utcnow()
             db.session.commit()
+            UserService.invalidate_user_statistics()
+            evict_cached_user(user_id)
 
             logger.info(f"User deactivated: {user.username} (ID: {user.id})")
 
@@ -700,6 +719,8 @@ class UserService:
             user.is_admin = is_admin
             user.updated_at = datetime.utcnow()
             db.session.commit()
+            UserService.invalidate_user_statistics()
+            evict_cached_user(user_id)
 
             status = "granted" if is_admin else "revoked"
             logger.info(
@@ -724,7 +745,10 @@ class UserService:
 
     @staticmethod
     def search_users(
-        search_term: str, limit: int = 20, include_inactive: bool = False
+        search_term: str,
+        limit: int = 20,
+        include_inactive: bool = False,
+        prefix_only: bool = False,
     ) -> List[User]:
         """
         Search users by username, email, or name.
@@ -733,6 +757,7 @@ class UserService:
             search_term (str): Search term
             limit (int): Maximum number of results
             include_inactive (bool): Whether to include inactive users
+            prefix_only (bool): Only match usernames/emails starting with the term
 
         Returns:
             List[User]: List of matching users
@@ -743,14 +768,8 @@ class UserService:
             return []
 
         try:
-            search_pattern = f"%{search_term.lower()}%"
             query = User.query.filter(
-                or_(
-                    User.username.ilike(search_pattern),
-                    User.email.ilike(search_pattern),
-                    User.first_name.ilike(search_pattern),
-                    User.last_name.ilike(search_pattern),
-                )
+                User.search_condition(search_term, prefix_only=prefix_only)
             )
 
             if not include_inactive:
@@ -770,22 +789,40 @@ class UserService:
         """
         Get user statistics.
 
+        Results are cached in-process for ``USER_STATISTICS_CACHE_TTL`` seconds
+        (default: 60) so dashboard polling does not rescan the users table.
+
         Returns:
             Dict[str, Any]: User statistics
         """
+        ttl = current_app.config.get("USER_STATISTICS_CACHE_TTL", 60)
+        now = time.monotonic()
+
+        with _statistics_lock:
+            cached = _statistics_cache["stats"]
+            expires_at = _statistics_cache["expires_at"]
+            generation = _statistics_cache["generation"]
+        if cached is not None and now < expires_at:
+            logger.debug("User statistics served from cache")
+            return dict(cached)
+
         logger.debug("Getting user statistics")
 
         try:
-            total_users = User.query.count()
-            active_users = User.query.filter_by(is_active=True).count()
-            verified_users = User.query.filter_by(is_verified=True).count()
-            admin_users = User.query.filter_by(is_admin=True).count()
-
             # Users created in last 30 days
-            from datetime import datetime, timedelta
-
             thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-            recent_users = User.query.filter(User.created_at >= thirty_days_ago).count()
+
+            # Single aggregate pass over the users table
+            row = db.session.query(
+                func.count(User.id),
+                func.sum(case((User.is_active.is_(True), 1), else_=0)),
+                func.sum(case((User.is_verified.is_(True), 1), else_=0)),
+                func.sum(case((User.is_admin.is_(True), 1), else_=0)),
+                func.sum(case((User.created_at >= thirty_days_ago, 1), else_=0)),
+            ).one()
+            total_users, active_users, verified_users, admin_users, recent_users = (
+                int(value or 0) for value in row
+            )
 
             stats = {
                 "total_users": total_users,
@@ -798,8 +835,14 @@ class UserService:
                 "generated_at": datetime.utcnow().isoformat(),
             }
 
+            if ttl > 0:
+                with _statistics_lock:
+                    if _statistics_cache["generation"] == generation:
+                        _statistics_cache["stats"] = stats
+                        _statistics_cache["expires_at"] = now + ttl
+
             logger.debug(f"User statistics generated: {stats}")
-            return stats
+            return dict(stats)
 
         except Exception as e:
             logger.error(f"Error getting user statistics: {e}")
@@ -809,6 +852,16 @@ class UserService:
                 status_code=500,
             )
 
+    @staticmethod
+    def invalidate_user_statistics() -> None:
+        """
+        Drop the cached user statistics so the next call recomputes them.
+        """
+        with _statistics_lock:
+            _statistics_cache["stats"] = None
+            _statistics_cache["expires_at"] = 0.0
+            _statistics_cache["generation"] += 1
+
     @staticmethod
     def check_user_permissions(user: User, required_permission: str) -> bool:
         """
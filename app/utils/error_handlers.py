@@ -375,6 +375,9 @@ def setup_error_monitoring(app):
         logger.info("Error monitoring disabled by configuration")
         return
 
+    # Resolve configuration once; the hooks below run on every request
+    slow_threshold = app.config.get("SLOW_REQUEST_THRESHOLD", 1.0)
+
     # Error statistics tracking
     error_stats = {
         "total_requests": 0,
@@ -397,7 +400,6 @@ def setup_error_monitoring(app):
             duration = (datetime.utcnow() - request.start_time).total_seconds()
 
             # Log slow requests
-            slow_threshold = app.config.get("SLOW_REQUEST_THRESHOLD", 1.0)
             if duration > slow_threshold:
                 error_stats["slow_requests"] += 1
                 logger.warning(
@@ -5,14 +5,20 @@ This module provides utilities for configuring structured logging with JSON form
 support and proper log level management.
 """
 
+import atexit
+import copy
 import json
 import logging
 import logging.handlers
+import queue
 import sys
 from datetime import datetime
 
 from flask import g, has_request_context, request
 
+# Background listener that drains queued log records to the real handlers
+_queue_listener = None
+
 
 class JSONFormatter(logging.Formatter):
     """
@@ -84,6 +90,33 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_data, default=str)
 
 
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler for an in-process queue that keeps exception info.
+
+    The stock ``prepare`` formats the record and drops ``exc_info`` so it can
+    be pickled; records here never leave the process, so downstream handlers
+    get the structured traceback just as they would without the queue.
+    """
+
+    def prepare(self, record):
+        """
+        Copy the record with its message merged, keeping exception info.
+
+        Args:
+            record: LogRecord instance
+
+        Returns:
+            logging.LogRecord: Record to enqueue
+        """
+        record = copy.copy(record)
+        # Merge args now, on the logging thread, in case they change later
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
 def configure_logging(app):
     """
     Configure application logging based on configuration.
@@ -106,6 +139,7 @@ def configure_logging(app):
     backup_count = app.config.get("LOG_BACKUP_COUNT", 5)
 
     # Clear existing handlers
+    _stop_queue_listener()
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
 
@@ -122,7 +156,7 @@ def configure_logging(app):
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if configured)
     if log_file:
@@ -131,7 +165,15 @@ def configure_logging(app):
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if app.config.get("LOG_QUEUE_ENABLED", False):
+        # Request threads only enqueue records; formatting and I/O happen on
+        # the listener thread
+        root_logger.addHandler(_start_queue_listener(handlers))
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # Configure Flask's logger
     app.logger.setLevel(log_level)
@@ -150,6 +192,46 @@ def configure_logging(app):
     app.logger.info(f"Logging configured - Level: {log_level}, JSON: {use_json_format}")
 
 
+def _start_queue_listener(handlers):
+    """
+    Start a background listener writing queued records to the given handlers.
+
+    Args:
+        handlers (list): Handlers that perform the actual formatting and I/O
+
+    Returns:
+        logging.handlers.QueueHandler: Handler to attach to the root logger
+    """
+    global _queue_listener
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _LocalQueueHandler(log_queue)
+    # Capture request context on the request thread, before the record is
+    # handed to the listener thread
+    queue_handler.addFilter(RequestContextFilter())
+
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+    return queue_handler
+
+
+def _stop_queue_listener():
+    """
+    Stop the background log listener, flushing any queued records.
+    """
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name):
     """
     Get a logger instance with the specified name.
@@ -14,6 +14,7 @@ import jsonschema
 from flask import jsonify, request
 from marshmallow import ValidationError as MarshmallowValidationError
 
+from app.schemas.registry import get_schema
 from app.utils.exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
@@ -43,7 +44,7 @@ def validate_json(schema_class: Type, location: str = "json") -> Callable:
         @wraps(f)
         def decorated_function(*args, **kwargs):
             try:
-                schema = schema_class()
+                schema = get_schema(schema_class)
 
                 # Get data based on location
                 if location == "json":
@@ -120,7 +121,7 @@ def serialize_response(
         ValidationError: If serialization fails
     """
     try:
-        schema = schema_class()
+        schema = get_schema(schema_class)
         return schema.dump(data, many=many)
     except Exception as e:
         logger.error(f"Serialization error: {e}")
@@ -373,7 +374,7 @@ class ValidationMixin:
         if data is None:
             data = request.get_json() or {}
 
-        schema = schema_class()
+        schema = get_schema(schema_class)
         return schema.load(data)
 
     def serialize_data(
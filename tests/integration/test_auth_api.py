@@ -7,10 +7,14 @@ API endpoints, database operations, and JWT token handling.
 
 import json
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
 
-from app.extensions import db
+from app import extensions
+from app.extensions import _user_cache, db
 from app.models.user import User
 from tests.utils import (
     APITestClient,
@@ -429,3 +433,100 @@ class TestAuthenticationAPI:
             ResponseTestHelper.assert_error_response(
                 response_data, status_code, "INVALID_CREDENTIALS"
             )
+
+
+@pytest.mark.integration
+@pytest.mark.api
+@pytest.mark.auth
+class TestJWTUserCache:
+    """Integration tests for the JWT user lookup cache."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, app, monkeypatch):
+        """Enable the user lookup cache and start each test with it empty."""
+        monkeypatch.setattr(extensions, "_user_cache_enabled", True)
+        _user_cache.clear()
+        yield
+        _user_cache.clear()
+
+    @staticmethod
+    def _headers(app, user):
+        with app.app_context():
+            token = create_access_token(identity=str(user.id))
+        return {"Authorization": f"Bearer {token}"}
+
+    def test_cache_hit_skips_database_lookup(self, client, app):
+        """Test that a repeat request is served from the cache."""
+        with app.app_context():
+            user = DatabaseTestHelper.create_user()
+        headers = self._headers(app, user)
+
+        assert client.get("/api/auth/me", headers=headers).status_code == 200
+
+        with patch.object(User, "get_by_id") as get_by_id:
+            response = client.get("/api/auth/me", headers=headers)
+            get_by_id.assert_not_called()
+
+        assert response.status_code == 200
+        assert response.get_json()["data"]["user"]["username"] == user.username
+
+    def test_expired_lock_is_served_from_cache(self, client, app):
+        """Test that a user whose lock has expired keeps working when cached."""
+        with app.app_context():
+            user = DatabaseTestHelper.create_user(
+                failed_login_attempts=5,
+                locked_until=datetime.utcnow() - timedelta(minutes=1),
+            )
+        headers = self._headers(app, user)
+
+        for _ in range(3):
+            assert client.get("/api/auth/me", headers=headers).status_code == 200
+
+    def test_lockout_evicts_cached_user(self, client, app):
+        """Test that locking the account stops cached tokens working."""
+        with app.app_context():
+            user = DatabaseTestHelper.create_user()
+        headers = self._headers(app, user)
+
+        assert client.get("/api/auth/me", headers=headers).status_code == 200
+
+        login_data = {"username_or_email": user.username, "password": "wrong-pass"}
+        for _ in range(5):
+            client.post("/api/auth/login", json=login_data)
+
+        assert client.get("/api/auth/me", headers=headers).status_code == 401
+
+    def test_change_password_loads_hash_with_user(self, client, app):
+        """Test that a password change loads the hash in the user lookup query."""
+        with app.app_context():
+            user = DatabaseTestHelper.create_user()
+        headers = self._headers(app, user)
+
+        # Warm the cache; the password change must not be served from it
+        assert client.get("/api/auth/me", headers=headers).status_code == 200
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with app.app_context():
+            event.listen(db.engine, "before_cursor_execute", record)
+            try:
+                response = client.post(
+                    "/api/auth/password/change",
+                    headers=headers,
+                    json={
+                        "current_password": "testpassword123",
+                        "new_password": "newpassword456",
+                    },
+                )
+            finally:
+                event.remove(db.engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        lookups = [s for s in statements if s.startswith("SELECT")]
+        # The user row and hash come from one query; no deferred hash load
+        assert "users.username" in lookups[0]
+        assert "users.password_hash" in lookups[0]
+        assert not any(s.startswith("SELECT users.password_hash ") for s in lookups)
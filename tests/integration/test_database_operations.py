@@ -214,6 +214,25 @@ class TestDatabaseOperations:
             offset_users = User.query.offset(2).all()
             assert len(offset_users) == 2
 
+    def test_iter_all_streams_in_batches(self, app):
+        """Test iterating over records in batches."""
+        with app.app_context():
+            users = [
+                User(username=f"stream{i}", email=f"stream{i}@example.com")
+                for i in range(7)
+            ]
+            for user in users:
+                user.set_password("password123")
+
+            db.session.add_all(users)
+            db.session.commit()
+
+            streamed = list(User.iter_all(batch_size=3))
+            assert [u.username for u in streamed] == [u.username for u in users]
+
+            page = list(User.iter_all(batch_size=2, offset=2, limit=3))
+            assert [u.username for u in page] == ["stream2", "stream3", "stream4"]
+
     def test_relationship_operations(self, app):
         """Test database relationship operations (when relationships exist)."""
         with app.app_context():
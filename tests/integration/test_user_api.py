@@ -5,6 +5,8 @@ This module tests the complete user management flow including
 API endpoints, database operations, and authorization.
 """
 
+from datetime import datetime, timedelta
+
 import pytest
 
 from app.extensions import db
@@ -533,3 +535,28 @@ class TestUserAPI:
         response_data, status_code = api_client.get_json("/api/users/profile", headers)
         ResponseTestHelper.assert_success_response(response_data, status_code)
         assert response_data["email"] == "email2@example.com"
+
+    def test_get_user_conditional_request(self, client, app):
+        """Test that a matching If-None-Match gets a 304 with the same validators."""
+        with app.app_context():
+            user = DatabaseTestHelper.create_user(
+                locked_until=datetime.utcnow() - timedelta(minutes=1)
+            )
+            access_token = AuthTestHelper.create_access_token(str(user.id))
+
+        headers = AuthTestHelper.get_auth_headers(access_token)
+        response = client.get(f"/api/users/{user.id}", headers=headers)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        cached = client.get(
+            f"/api/users/{user.id}", headers={**headers, "If-None-Match": etag}
+        )
+
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert cached.headers["Cache-Control"] == response.headers["Cache-Control"]
+
+        # Computing the ETag must not clear the expired lock
+        with app.app_context():
+            assert db.session.get(User, user.id).locked_until is not None
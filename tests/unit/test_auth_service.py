@@ -8,6 +8,7 @@ focusing on business logic and error handling.
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
+import jwt
 import pytest
 
 from app.models.user import User
@@ -150,6 +151,23 @@ class TestAuthService:
         mock_access_token.assert_called_once_with(identity=1)
         mock_refresh_token.assert_called_once_with(identity=1)
 
+    def test_generate_tokens_signs_new_tokens_per_call(self, app):
+        """Test that every login gets its own tokens, with distinct jti claims."""
+        user = MagicMock()
+        user.id = 1
+
+        with app.test_request_context():
+            first = AuthService._generate_tokens(user)
+            second = AuthService._generate_tokens(user)
+
+        claims = [
+            jwt.decode(tokens["access_token"], options={"verify_signature": False})
+            for tokens in (first, second)
+        ]
+
+        assert first["access_token"] != second["access_token"]
+        assert claims[0]["jti"] != claims[1]["jti"]
+
     @patch("app.services.auth_service.AuthService._validate_login_data")
     @patch("app.services.auth_service.AuthService._find_user_by_username_or_email")
     @patch("app.services.auth_service.AuthService._generate_tokens")
@@ -0,0 +1,64 @@
+"""
+Unit tests for logging configuration.
+
+This module tests the queued logging path against direct handler output.
+"""
+
+import logging
+
+import pytest
+
+from app.utils.logging_config import (
+    JSONFormatter,
+    _start_queue_listener,
+    _stop_queue_listener,
+)
+
+
+class _RecordingHandler(logging.Handler):
+    """Handler that keeps the records it receives."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.mark.unit
+class TestQueuedLogging:
+    """Test cases for the background log listener."""
+
+    @staticmethod
+    def _log_exception(handler):
+        logger = logging.getLogger("tests.queued_logging")
+        logger.propagate = False
+        logger.addHandler(handler)
+        try:
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.exception("Failed for %s", "user")
+        finally:
+            logger.removeHandler(handler)
+
+    def test_exception_output_matches_synchronous_path(self):
+        """Test that queued records keep exc_info and format like direct ones."""
+        direct = _RecordingHandler()
+        self._log_exception(direct)
+
+        queued = _RecordingHandler()
+        try:
+            self._log_exception(_start_queue_listener([queued]))
+        finally:
+            _stop_queue_listener()
+
+        direct_record, queued_record = direct.records[0], queued.records[0]
+        assert queued_record.exc_info is not None
+        assert queued_record.exc_info[0] is ValueError
+        assert queued_record.getMessage() == "Failed for user"
+
+        formatter = JSONFormatter()
+        direct_output = formatter.formatException(direct_record.exc_info)
+        assert formatter.formatException(queued_record.exc_info) == direct_output
@@ -0,0 +1,53 @@
+"""
+Unit tests for Marshmallow schemas.
+
+This module tests schema loading behaviour in isolation.
+"""
+
+import pytest
+from marshmallow import ValidationError
+
+from app.schemas.auth_schemas import LoginRequestSchema, RegisterRequestSchema
+from app.schemas.registry import get_schema
+from app.schemas.user_schemas import UpdateUserRequestSchema
+
+
+@pytest.mark.unit
+@pytest.mark.validation
+class TestSchemaRegistry:
+    """Test cases for shared schema instances."""
+
+    def test_returns_same_instance_for_same_options(self):
+        """Test that equivalent options share one instance."""
+        first = get_schema(RegisterRequestSchema, only=["username", "email"])
+        second = get_schema(RegisterRequestSchema, only=("email", "username"))
+
+        assert first is second
+        assert set(first.fields) == {"username", "email"}
+
+    def test_distinct_options_get_distinct_instances(self):
+        """Test that differing options are cached separately."""
+        single = get_schema(LoginRequestSchema)
+        many = get_schema(LoginRequestSchema, many=True)
+        partial = get_schema(LoginRequestSchema, partial=["password"])
+
+        assert len({id(single), id(many), id(partial)}) == 3
+        assert many.many is True
+        assert partial.partial == ("password",)
+
+
+@pytest.mark.unit
+@pytest.mark.validation
+class TestUpdateUserRequestSchema:
+    """Test cases for update request validation."""
+
+    def test_accepts_false_only_update(self):
+        """Test that an update setting only a flag to False is accepted."""
+        assert UpdateUserRequestSchema().load({"is_active": False}) == {
+            "is_active": False
+        }
+
+    def test_rejects_empty_update(self):
+        """Test that an update without any fields is rejected."""
+        with pytest.raises(ValidationError):
+            UpdateUserRequestSchema().load({})
@@ -9,6 +9,8 @@ from datetime import datetime
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy import text
+from werkzeug.security import check_password_hash, generate_password_hash
 
 from app.extensions import db
 from app.models.user import User
@@ -67,6 +69,65 @@ class TestUserModel:
 
             assert user.check_password("wrongpassword") is False
 
+    def test_failed_checks_increment_atomically(self, app):
+        """Test that repeated failures count in the database and lock the user."""
+        with app.app_context():
+            user = User(username="testuser", email="test@example.com")
+            user.set_password("testpassword123")
+            db.session.add(user)
+            db.session.commit()
+
+            assert user.check_password("wrongpassword") is False
+            assert user.check_password("wrongpassword") is False
+            assert user.failed_login_attempts == 2
+            assert user.locked_until is None
+
+            # Failures recorded concurrently by another worker count too
+            db.session.execute(
+                text("UPDATE users SET failed_login_attempts = 4 WHERE id = :id"),
+                {"id": user.id},
+            )
+            assert user.check_password("wrongpassword") is False
+            assert user.failed_login_attempts == 5
+            assert user.locked_until is not None
+
+            db.session.commit()
+            assert user.failed_login_attempts == 5
+
+    def test_check_password_reuses_recent_verification(self, app):
+        """Test that a recently verified password skips rehashing."""
+        with app.app_context():
+            user = User(username="testuser", email="test@example.com")
+            user.set_password("testpassword123")
+            db.session.add(user)
+            db.session.commit()
+
+            assert user.check_password("testpassword123") is True
+
+            with patch(
+                "app.models.user._verify_password", return_value=False
+            ) as verify:
+                assert user.check_password("testpassword123") is True
+                verify.assert_not_called()
+
+                assert user.check_password("wrongpassword") is False
+                verify.assert_called_once()
+
+    def test_rehash_legacy_pbkdf2_password(self, app):
+        """Test that a verified PBKDF2 hash is upgraded to scrypt."""
+        with app.app_context():
+            user = User(username="testuser", email="test@example.com")
+            user.password_hash = generate_password_hash(
+                "testpassword123", method="pbkdf2:sha256:1000"
+            )
+
+            assert user.check_password("testpassword123") is True
+            assert user.rehash_password_if_needed("testpassword123") is True
+            assert user.password_hash.startswith("scrypt:")
+            assert check_password_hash(user.password_hash, "testpassword123")
+            assert user.check_password("testpassword123") is True
+            assert user.rehash_password_if_needed("testpassword123") is False
+
     def test_check_password_no_password_set(self, app):
         """Test password verification when no password is set."""
         with app.app_context():
@@ -360,3 +421,69 @@ class TestUserModel:
             assert loaded_user.username == "testuser"
             assert loaded_user.email == "test@example.com"
             assert loaded_user.check_password("testpassword123") is True
+
+    def test_full_name_generated_column(self, app):
+        """Test that the stored full name tracks the name fields."""
+        with app.app_context():
+            user = User(username="testuser", email="test@example.com", first_name="Ada")
+            user.set_password("testpassword123")
+            assert user.get_full_name() == "Ada"
+
+            db.session.add(user)
+            db.session.commit()
+            assert user.full_name == "Ada"
+
+            user.last_name = "Lovelace"
+            assert user.get_full_name() == "Ada Lovelace"
+            db.session.commit()
+            assert user.full_name == "Ada Lovelace"
+
+            user.first_name = None
+            user.last_name = None
+            db.session.commit()
+            assert user.full_name is None
+            assert user.get_full_name() == "testuser"
+
+    def test_search_users_substring_stays_within_columns(self, app):
+        """Test that substring search matches single columns only, literally."""
+        with app.app_context():
+            user = User(
+                username="adal",
+                email="ada@example.com",
+                first_name="Ada",
+                last_name="Lovelace",
+            )
+            user.set_password("testpassword123")
+            db.session.add(user)
+            db.session.commit()
+
+            assert User.search_users("LOVE") == [user]
+            assert User.search_users("example.com") == [user]
+            assert User.search_users("babbage") == []
+
+            # No match across the end of one column and the start of the next
+            assert User.search_users("ada love") == []
+            assert User.search_users("comada") == []
+
+            # LIKE wildcards in the term are literal
+            assert User.search_users("%") == []
+            assert User.search_users("a_a") == []
+
+    def test_lookups_are_memoized_per_request(self, app):
+        """Test that repeated lookups in one request reuse the loaded user."""
+        with app.app_context():
+            user = User(username="adal", email="ada@example.com")
+            user.set_password("testpassword123")
+            db.session.add(user)
+            db.session.commit()
+
+            with app.test_request_context():
+                assert User.get_by_username("ADAL") is user
+
+                with patch.object(User, "_login_query") as login_query:
+                    assert User.get_by_email("ada@example.com") is user
+                    assert User.get_by_login("adal") is user
+                    login_query.assert_not_called()
+
+                user.username = "ada"
+                assert User.get_by_username("adal") is None
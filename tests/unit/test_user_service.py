@@ -8,9 +8,12 @@ focusing on business logic and error handling.
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy import event
 
+from app.extensions import db
 from app.models.user import User
-from app.services.user_service import UserService
+from app.services.auth_service import AuthService
+from app.services.user_service import UserService, _statistics_cache
 from app.utils.exceptions import (
     AuthorizationError,
     DuplicateResourceError,
@@ -374,7 +377,8 @@ class TestUserService:
     def test_search_users_by_username(self, mock_user_model):
         """Test user search by username."""
         mock_users = [MagicMock(), MagicMock()]
-        mock_user_model.query.filter.return_value.all.return_value = mock_users
+        mock_query = mock_user_model.query.filter.return_value.filter_by.return_value
+        mock_query.limit.return_value.all.return_value = mock_users
 
         result = UserService.search_users("test")
 
@@ -385,7 +389,8 @@ class TestUserService:
     @patch("app.services.user_service.User")
     def test_search_users_no_results(self, mock_user_model):
         """Test user search with no results."""
-        mock_user_model.query.filter.return_value.all.return_value = []
+        mock_query = mock_user_model.query.filter.return_value.filter_by.return_value
+        mock_query.limit.return_value.all.return_value = []
 
         result = UserService.search_users("nonexistent")
 
@@ -417,3 +422,50 @@ class TestUserService:
 
         with pytest.raises(AuthorizationError):
             UserService.check_user_modification_permission(1, 2)
+
+    def test_statistics_cache_refreshed_after_register(self, app, monkeypatch):
+        """Test that registering and verifying a user updates cached statistics."""
+        monkeypatch.setitem(app.config, "USER_STATISTICS_CACHE_TTL", 60)
+
+        with app.test_request_context():
+            UserService.invalidate_user_statistics()
+            try:
+                before = UserService.get_user_statistics()
+
+                result = AuthService.register(
+                    username="newuser",
+                    email="newuser@example.com",
+                    password="Password123!",
+                )
+                after_register = UserService.get_user_statistics()
+
+                AuthService.verify_email(result["verification_token"])
+                after_verify = UserService.get_user_statistics()
+            finally:
+                UserService.invalidate_user_statistics()
+
+        assert after_register["total_users"] == before["total_users"] + 1
+        assert after_verify["verified_users"] == before["verified_users"] + 1
+
+    def test_statistics_not_cached_when_invalidated_during_query(
+        self, app, monkeypatch
+    ):
+        """Test that stats computed before an invalidation are not cached."""
+        monkeypatch.setitem(app.config, "USER_STATISTICS_CACHE_TTL", 60)
+
+        def invalidate_mid_query(*args, **kwargs):
+            UserService.invalidate_user_statistics()
+
+        with app.test_request_context():
+            engine = db.engine
+            UserService.invalidate_user_statistics()
+            event.listen(engine, "before_cursor_execute", invalidate_mid_query)
+            try:
+                UserService.get_user_statistics()
+            finally:
+                event.remove(engine, "before_cursor_execute", invalidate_mid_query)
+
+            try:
+                assert _statistics_cache["stats"] is None
+            finally:
+                UserService.invalidate_user_statistics()